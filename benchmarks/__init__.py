@@ -0,0 +1 @@
+"""Benchmarks for Ufanet intercom integration."""
@@ -0,0 +1,42 @@
+"""Setup shared by the benchmarks."""
+
+import tempfile
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ufanet_intercom.const import CONF_HOST
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.hub import TokenBucket, UfanetHub, async_get_hub
+
+
+def make_hass() -> HomeAssistant:
+    """Return a bare Home Assistant with a throwaway config dir."""
+    return HomeAssistant(tempfile.mkdtemp())
+
+
+def make_hub(hass: HomeAssistant) -> UfanetHub:
+    """Return the shared hub without the global rate limit."""
+    hub = async_get_hub(hass)
+    # Measure the client, not the rate limit.
+    hub.limiter = TokenBucket(1e6, 10**6)
+    return hub
+
+
+def make_entry(url: str | None = None, **options) -> SimpleNamespace:
+    """Return a stand-in for a config entry talking to url."""
+    return SimpleNamespace(
+        entry_id="bench",
+        data={"contract": "bench", "password": "bench", CONF_HOST: url},
+        options=options,
+        async_create_background_task=lambda hass, target, name: (
+            hass.async_create_background_task(target, name)
+        ),
+    )
+
+
+def make_coordinator(hass: HomeAssistant, url: str) -> UfanetDataCoordinator:
+    """Return a coordinator whose every request reaches the server."""
+    coordinator = UfanetDataCoordinator(hass, make_entry(url), make_hub(hass))
+    coordinator.api.coalesce_window = 0
+    return coordinator
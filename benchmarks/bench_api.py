@@ -0,0 +1,115 @@
+"""Benchmark UfanetAPI and UfanetDataCoordinator against the fake server.
+
+Reports update cycle latency with changed and unchanged payloads, memory
+allocated per cycle, and open door latency percentiles while the camera
+list grows. Run from the repository root:
+
+    python -m benchmarks.bench_api --cameras 10 100 1000 5000 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+
+from ._common import make_coordinator, make_hass
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+def percentiles(samples: list[float]) -> tuple[float, float, float]:
+    """Return p50, p95 and p99 in milliseconds."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000
+
+
+async def measure_cycle(
+    coordinator: UfanetDataCoordinator, changed: bool
+) -> tuple[float, int]:
+    """Run one full update cycle, return seconds and peak bytes allocated."""
+    # Make every endpoint due, and forget parsed payloads to force parsing.
+    coordinator._last_fetch.clear()  # noqa: SLF001
+    if changed:
+        coordinator.api._responses.clear()  # noqa: SLF001
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    if not coordinator.last_update_success:
+        raise RuntimeError(f"Update failed: {coordinator.last_exception}")
+    return elapsed, peak - before
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    server = FakeUfanet(
+        FakeUfanetConfig(
+            intercoms=args.intercoms,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+        )
+    )
+    url = await server.start()
+    hass = make_hass()
+    coordinator = make_coordinator(hass, url)
+
+    print(
+        f"{'cameras':>8} | {'changed p50/p95 ms':>19} | {'unchanged p50/p95 ms':>20}"
+        f" | {'peak KiB':>9} | {'door p50/p95/p99 ms':>20}"
+    )
+    tracemalloc.start()
+    try:
+        for count in args.cameras:
+            server.set_payload(cameras=count)
+            await measure_cycle(coordinator, changed=True)
+
+            changed, unchanged, peaks = [], [], []
+            for _ in range(args.cycles):
+                elapsed, peak = await measure_cycle(coordinator, changed=True)
+                changed.append(elapsed)
+                peaks.append(peak)
+                elapsed, _ = await measure_cycle(coordinator, changed=False)
+                unchanged.append(elapsed)
+
+            doors = []
+            for i in range(args.opens):
+                coordinator.doors._last_open.clear()  # noqa: SLF001
+                start = time.perf_counter()
+                await coordinator.doors.async_open(i % args.intercoms)
+                doors.append(time.perf_counter() - start)
+
+            c50, c95, _ = percentiles(changed)
+            u50, u95, _ = percentiles(unchanged)
+            d50, d95, d99 = percentiles(doors)
+            print(
+                f"{count:>8} | {c50:>9.2f}/{c95:<9.2f} | {u50:>10.2f}/{u95:<9.2f}"
+                f" | {statistics.median(peaks) / 1024:>9.0f}"
+                f" | {d50:>6.2f}/{d95:>6.2f}/{d99:<6.2f}"
+            )
+    finally:
+        tracemalloc.stop()
+        await coordinator.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    print(f"requests served: {server.config.requests}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cameras", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--intercoms", type=int, default=4)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--opens", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,62 @@
+"""Opening several doors one after another against the open_doors helper.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_doors --doors 3 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+from custom_components.ufanet_intercom.const import DOOR_OPEN_DEADLINE
+from custom_components.ufanet_intercom.door import async_open_doors
+
+from ._common import make_coordinator, make_hass
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    server = FakeUfanet(
+        FakeUfanetConfig(intercoms=args.doors * 2, latency=args.latency)
+    )
+    url = await server.start()
+    hass = make_hass()
+    coordinator = make_coordinator(hass, url)
+    doors = coordinator.doors
+    try:
+        await coordinator.api.async_authenticate()
+        # Warm up the connection pool like the keepalive does.
+        await asyncio.gather(*(coordinator.api.async_ping() for _ in range(args.doors)))
+
+        start = time.perf_counter()
+        for intercom_id in range(args.doors):
+            await doors.async_open(intercom_id)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await async_open_doors(
+            [(doors, intercom_id) for intercom_id in range(args.doors, args.doors * 2)],
+            args.parallel,
+            DOOR_OPEN_DEADLINE,
+        )
+        concurrent = time.perf_counter() - start
+        assert all(result["success"] for result in results), results
+    finally:
+        await coordinator.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    print(f"{args.doors} doors, {args.latency * 1000:.0f} ms round trip")
+    print(f"  one after another  {sequential * 1000:8.1f} ms")
+    print(f"  open_doors         {concurrent * 1000:8.1f} ms")
+    print(f"  per door latency   {[result['latency'] for result in results]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--doors", type=int, default=3)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
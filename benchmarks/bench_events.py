@@ -0,0 +1,65 @@
+"""Ring to Home Assistant latency of the event channel.
+
+Pushes rings on the fake server and measures when they reach the intercom
+dispatcher signal, compared with the average delay of polling. Run from the
+repository root:
+
+    python -m benchmarks.bench_events --rings 50 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import time
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.ufanet_intercom.const import (
+    SIGNAL_INTERCOM_EVENT,
+    UPDATE_INTERVAL,
+)
+
+from ._common import make_coordinator, make_hass
+from .bench_api import percentiles
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    server = FakeUfanet(FakeUfanetConfig(latency=args.latency))
+    url = await server.start()
+    hass = make_hass()
+    coordinator = make_coordinator(hass, url)
+
+    received: asyncio.Queue[float] = asyncio.Queue()
+    async_dispatcher_connect(
+        hass,
+        SIGNAL_INTERCOM_EVENT.format(entry_id="bench", intercom_id=0),
+        lambda event: received.put_nowait(time.time() - event["time"]),
+    )
+    coordinator.events.async_start()
+    try:
+        while not coordinator.events.healthy:
+            await asyncio.sleep(0.01)
+        delays = []
+        for _ in range(args.rings):
+            # Let the listener get back into its long-poll.
+            await asyncio.sleep(args.interval)
+            await server.push_event(0)
+            delays.append(await asyncio.wait_for(received.get(), 10))
+    finally:
+        await coordinator.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    p50, p95, p99 = percentiles(delays)
+    print(f"push   p50/p95/p99 ms: {p50:.1f}/{p95:.1f}/{p99:.1f}")
+    print(f"poll   average ms:     {UPDATE_INTERVAL * 1000 / 2:.1f}")
+    print(f"requests served: {server.config.requests}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rings", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.0)
+    asyncio.run(run(parser.parse_args()))
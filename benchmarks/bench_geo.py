@@ -0,0 +1,99 @@
+"""Radius and nearest camera queries, grid index against a linear scan.
+
+Cameras are scattered over a city sized area. Run from the repository root:
+
+    python -m benchmarks.bench_geo [count ...]
+"""
+
+import random
+import sys
+import time
+
+from custom_components.ufanet_intercom.geo import CameraIndex, distance
+from custom_components.ufanet_intercom.models import UCamera
+
+from .bench_models import make_cameras
+
+HOME = (54.7348, 55.9579)
+RADIUS = 1000
+NEAREST = 5
+QUERIES = 200
+
+
+def scatter(count: int) -> list[UCamera]:
+    """Return cameras spread over about 30 by 30 km around home."""
+    rng = random.Random(count)
+    data = make_cameras(count)
+    for item in data:
+        item["latitude"] = HOME[0] + rng.uniform(-0.135, 0.135)
+        item["longitude"] = HOME[1] + rng.uniform(-0.235, 0.235)
+    return [UCamera(**item) for item in data]
+
+
+def best(func, rounds: int = 5) -> float:
+    """Return best time of func in ms."""
+    elapsed = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed * 1000
+
+
+def main(counts: list[int]) -> None:
+    """Run benchmark."""
+    rng = random.Random(0)
+    points = [
+        (HOME[0] + rng.uniform(-0.1, 0.1), HOME[1] + rng.uniform(-0.2, 0.2))
+        for _ in range(QUERIES)
+    ]
+    for count in counts:
+        cameras = scatter(count)
+        index = CameraIndex(cameras)
+
+        def scan_within() -> list[list[UCamera]]:
+            return [
+                [
+                    c
+                    for c in cameras
+                    if distance(lat, lon, c.latitude, c.longitude) <= RADIUS
+                ]
+                for lat, lon in points
+            ]
+
+        def scan_nearest() -> list[list[UCamera]]:
+            return [
+                sorted(
+                    cameras,
+                    key=lambda c: distance(lat, lon, c.latitude, c.longitude),
+                )[:NEAREST]
+                for lat, lon in points
+            ]
+
+        # Same answers as the scan.
+        for (lat, lon), scanned in zip(points, scan_within()):
+            assert {c.number for c in index.within(lat, lon, RADIUS)} == {
+                c.number for c in scanned
+            }
+        for (lat, lon), scanned in zip(points, scan_nearest()):
+            assert [c.number for _, c in index.nearest(lat, lon, NEAREST)] == [
+                c.number for c in scanned
+            ]
+
+        print(f"{count} cameras, {QUERIES} queries")
+        print(f"  build index          {best(lambda: CameraIndex(cameras)):9.2f} ms")
+        print(f"  within {RADIUS} m, scan   {best(scan_within):9.2f} ms")
+        print(
+            f"  within {RADIUS} m, index  "
+            f"{best(lambda: [index.within(*p, RADIUS) for p in points]):9.2f} ms"
+        )
+        print(f"  nearest {NEAREST}, scan      {best(scan_nearest, 1):9.2f} ms")
+        print(
+            f"  nearest {NEAREST}, index     "
+            f"{best(lambda: [index.nearest(*p, NEAREST) for p in points]):9.2f} ms"
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 5000])
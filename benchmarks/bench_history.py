@@ -0,0 +1,86 @@
+"""Incremental history sync and local queries.
+
+Syncs a long history from the fake server once, then measures what a later
+sync and a "who opened door X in the last hour" query cost. Run from the
+repository root:
+
+    python -m benchmarks.bench_history --records 20000 --new 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from custom_components.ufanet_intercom.api import UfanetAPI
+from custom_components.ufanet_intercom.const import EVENT_DOOR_OPENED
+from custom_components.ufanet_intercom.history import HistoryStore
+
+from ._common import make_entry, make_hass, make_hub
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+def served(server: FakeUfanet) -> int:
+    """Return history requests served so far."""
+    return sum(
+        count for path, count in server.config.requests.items() if "history" in path
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    server = FakeUfanet(FakeUfanetConfig(history=args.records, latency=args.latency))
+    url = await server.start()
+    hass = make_hass()
+    entry = make_entry(url)
+    api = UfanetAPI(hass, "bench", "bench", make_hub(hass), url)
+    try:
+        store = HistoryStore(hass, entry, api)
+        start = time.perf_counter()
+        while await store.async_sync():
+            pass
+        initial = time.perf_counter() - start
+        initial_requests = served(server)
+        await store.async_stop()
+
+        # A restart restores the buffer and the cursor from disk.
+        store = HistoryStore(hass, entry, api)
+        start = time.perf_counter()
+        await store.async_load()
+        loaded = time.perf_counter() - start
+        server.add_history(args.new)
+        before = served(server)
+        start = time.perf_counter()
+        added = await store.async_sync()
+        incremental = time.perf_counter() - start
+        incremental_requests = served(server) - before
+
+        since = time.time() - 3600
+        start = time.perf_counter()
+        for _ in range(100):
+            found = store.query(1, since, [EVENT_DOOR_OPENED])
+        query = (time.perf_counter() - start) / 100
+        await store.async_stop()
+    finally:
+        await api.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    print(f"{args.records} records, {args.latency * 1000:.0f} ms round trip")
+    print(
+        f"  initial sync      {initial * 1000:8.1f} ms, {initial_requests} requests, "
+        f"{len(store)} kept"
+    )
+    print(f"  load from disk    {loaded * 1000:8.1f} ms")
+    print(
+        f"  sync {args.new} new      {incremental * 1000:8.1f} ms, "
+        f"{incremental_requests} request, {added} added"
+    )
+    print(f"  last hour query   {query * 1e6:8.1f} us, {len(found)} door openings")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--new", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,62 @@
+"""Cost of redacted debug logging of a camera payload.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_logging [cameras]
+"""
+
+import io
+import logging
+import sys
+import timeit
+
+from custom_components.ufanet_intercom.safe_logger import RedactingFilter
+
+from .bench_models import make_cameras
+
+
+def _logger(name: str, level: int, redact: bool) -> logging.Logger:
+    """Return isolated logger writing to memory."""
+    logger = logging.Logger(name, level)
+    logger.addHandler(logging.StreamHandler(io.StringIO()))
+    if redact:
+        logger.addFilter(RedactingFilter())
+    return logger
+
+
+def bench(label: str, func, number: int) -> None:
+    """Print time per call."""
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<36} {best * 1e6:>10.2f} us/call")
+
+
+def main(count: int) -> None:
+    """Run benchmark."""
+    payload = make_cameras(count)
+    masker = RedactingFilter()
+    print(f"camera payload with {count} items")
+
+    for level, name in ((logging.INFO, "debug disabled"), (logging.DEBUG, "enabled")):
+        number = 100_000 if level == logging.INFO else 200
+        plain = _logger("plain", level, redact=False)
+        redacted = _logger("redacted", level, redact=True)
+        bench(
+            f"plain logger, {name}",
+            lambda: plain.debug("Cameras: %s", payload),
+            number,
+        )
+        bench(
+            f"RedactingFilter, {name}",
+            lambda: redacted.debug("Cameras: %s", payload),
+            number,
+        )
+        # Masking before every call, as SafeLogger.safe used to.
+        bench(
+            f"eager masking, {name}",
+            lambda: plain.debug("Cameras: %s", masker.render(payload)),
+            min(number, 200),
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,75 @@
+"""Parse time and memory of camera models.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_models [count ...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from custom_components.ufanet_intercom.models import UCamera
+from custom_components.ufanet_intercom.parsing import ModelParser
+
+
+def make_cameras(count: int, servers: int = 8) -> list[dict]:
+    """Return fake camera payload."""
+    return [
+        {
+            "number": f"1{i:09d}",
+            "latitude": 54.7 + i / 1e5,
+            "longitude": 55.9 + i / 1e5,
+            "title": f"Подъезд {i % 12 + 1}",
+            "address": f"Уфа, ул. Ленина, {i % 300}",
+            "token_l": f"{i:032x}",
+            "token_r": f"{i * 7:032x}",
+            "servers": {
+                "server": True,
+                "domain": f"s{i % servers}.cams.ufanet.ru",
+                "screenshot_domain": f"s{i % servers}.shots.ufanet.ru",
+                "vendor_name": "flussonic",
+            },
+            "type": "public" if i % 3 else "private",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(label: str, func, data: list[dict], rounds: int = 5) -> None:
+    """Print best time and retained memory of func(data)."""
+    elapsed = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func(data)
+        _ = [camera.rtsp_url for camera in result]
+        elapsed = min(elapsed, time.perf_counter() - start)
+    del result
+
+    # Memory is measured separately, tracing slows allocations down.
+    tracemalloc.start()
+    result = func(data)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {elapsed * 1000:9.2f} ms {current / len(data):9.0f} B/camera")
+
+
+def main(counts: list[int]) -> None:
+    """Run benchmark."""
+    for count in counts:
+        data = make_cameras(count)
+        print(f"{count} cameras")
+        measure("validated", lambda d: [UCamera(**i) for i in d], data)
+        measure(
+            "parser, first sight",
+            lambda d: ModelParser(UCamera, "number").parse_list(d),
+            data,
+        )
+        parser = ModelParser(UCamera, "number")
+        parser.parse_list(data)
+        measure("parser, unchanged", parser.parse_list, data)
+        print()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 5000])
@@ -0,0 +1,97 @@
+"""Requests per simulated day with adaptive polling.
+
+Drives the coordinator against the fake server on a simulated clock and
+counts requests, in steady state and with a burst of intercom use every
+hour. Run from the repository root:
+
+    python -m benchmarks.bench_polling --hours 24
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from custom_components.ufanet_intercom import coordinator as coordinator_module
+from custom_components.ufanet_intercom.const import (
+    CAMERAS_UPDATE_INTERVAL,
+    CONTRACTS_UPDATE_INTERVAL,
+    INTERCOMS_UPDATE_INTERVAL,
+)
+
+from ._common import make_coordinator, make_hass
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+class SimClock:
+    """Stand-in for the time module with a movable clock."""
+
+    def __init__(self) -> None:
+        """Start at the real time."""
+        self.now = time.time()
+
+    def time(self) -> float:
+        """Return simulated wall time."""
+        return self.now
+
+    def monotonic(self) -> float:
+        """Return simulated monotonic time."""
+        return self.now
+
+
+async def simulate(hours: float, busy: bool) -> dict[str, int]:
+    """Return requests per endpoint served during the simulation."""
+    server = FakeUfanet(FakeUfanetConfig(cameras=100))
+    url = await server.start()
+    hass = make_hass()
+    clock = SimClock()
+    with patch.object(coordinator_module, "time", clock):
+        coordinator = make_coordinator(hass, url)
+        coordinator._phase = 0  # noqa: SLF001
+        end = clock.now + hours * 3600
+        next_busy = clock.now + 3600
+        try:
+            while clock.now < end:
+                coordinator.data = (
+                    await coordinator._async_update_data()
+                )  # noqa: SLF001
+                clock.now += coordinator.update_interval.total_seconds()
+                if busy and clock.now >= next_busy:
+                    next_busy += 3600
+                    coordinator._boost_until = clock.now + 120  # noqa: SLF001
+        finally:
+            await coordinator.async_shutdown()
+            await server.stop()
+            await hass.async_stop(force=True)
+    return {
+        path: count
+        for path, count in server.config.requests.items()
+        if "auth" not in path
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    fixed = (
+        args.hours
+        * 3600
+        * sum(
+            1 / interval
+            for interval in (
+                CAMERAS_UPDATE_INTERVAL,
+                INTERCOMS_UPDATE_INTERVAL,
+                CONTRACTS_UPDATE_INTERVAL,
+            )
+        )
+    )
+    print(f"fixed intervals:           {fixed:>6.0f} requests")
+    for busy in (False, True):
+        requests = await simulate(args.hours, busy)
+        label = "adaptive, busy hourly:" if busy else "adaptive, steady state:"
+        print(f"{label:<26} {sum(requests.values()):>6} requests {requests}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=float, default=24)
+    asyncio.run(run(parser.parse_args()))
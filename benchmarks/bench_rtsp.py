@@ -0,0 +1,89 @@
+"""RTSP health probe rounds against local stand-in servers.
+
+Probes cameras spread over several fake RTSP servers, some of them dead,
+then takes one server down. Run from the repository root:
+
+    python -m benchmarks.bench_rtsp --cameras 1000 --servers 8 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import time
+
+from custom_components.ufanet_intercom.models import UCamera
+from custom_components.ufanet_intercom.rtsp import CameraProber
+
+from ._common import make_entry, make_hass
+from .bench_models import make_cameras
+from .fake_rtsp import FakeRtsp, FakeRtspConfig
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    servers = [
+        FakeRtsp(FakeRtspConfig(latency=args.latency)) for _ in range(args.servers)
+    ]
+    domains = [await server.start() for server in servers]
+    data = make_cameras(args.cameras)
+    for i, item in enumerate(data):
+        item["servers"]["domain"] = domains[i % args.servers]
+        if i % 50 == 0:
+            servers[i % args.servers].config.dead.add(item["number"])
+    cameras = [UCamera(**item) for item in data]
+
+    hass = make_hass()
+    changes: list[int] = []
+    prober = CameraProber(
+        hass,
+        make_entry(),
+        lambda numbers: changes.append(len(numbers)),
+    )
+    try:
+        start = time.perf_counter()
+        await prober.async_probe_due(cameras)
+        first = time.perf_counter() - start
+        summary = prober.as_dict()
+
+        # Nothing is due right after a round.
+        start = time.perf_counter()
+        await prober.async_probe_due(cameras)
+        idle = time.perf_counter() - start
+
+        await servers[0].stop()
+        for state in prober.states.values():
+            state.next_probe = 0
+        connections = sum(server.config.connections for server in servers)
+        start = time.perf_counter()
+        await prober.async_probe_due(cameras)
+        down = time.perf_counter() - start
+        attempts = prober.probes - summary["probes"]
+        reconnects = sum(server.config.connections for server in servers) - connections
+    finally:
+        for server in servers:
+            await server.stop()
+        await hass.async_stop(force=True)
+
+    print(
+        f"{args.cameras} cameras on {args.servers} servers, "
+        f"{args.latency * 1000:.0f} ms per request"
+    )
+    print(
+        f"  first round      {first * 1000:8.1f} ms, {summary['probes']} probes, "
+        f"{summary['unavailable']} unavailable, p50 "
+        f"{summary['latency_p50'] * 1000:.1f} ms"
+    )
+    print(f"  idle round       {idle * 1000:8.1f} ms")
+    print(
+        f"  one server down  {down * 1000:8.1f} ms, {attempts} probes, "
+        f"{reconnects} connections, {prober.as_dict()['unavailable']} unavailable, "
+        f"servers down {prober.as_dict()['servers_down']}"
+    )
+    print(f"  state writes     {changes}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cameras", type=int, default=1000)
+    parser.add_argument("--servers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,84 @@
+"""Connection reuse of the hub pool and cost of building requests.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_transport --requests 200 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import timeit
+
+from custom_components.ufanet_intercom.api import UfanetAPI
+from custom_components.ufanet_intercom.const import API_CAMERAS, API_TIMEOUT
+from custom_components.ufanet_intercom.transport import RequestTemplates
+
+from ._common import make_hass, make_hub
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+def build_costs(host: str) -> tuple[float, float]:
+    """Return us per request to build url, headers and timeout, ad hoc and templated."""
+    from aiohttp import ClientTimeout
+    from yarl import URL
+
+    access = "a" * 200
+    templates = RequestTemplates(host)
+    number = 100_000
+    ad_hoc = timeit.timeit(
+        lambda: (
+            URL(f"{host}{API_CAMERAS}"),
+            {**{}, "Authorization": f"JWT {access}"},
+            ClientTimeout(total=API_TIMEOUT),
+        ),
+        number=number,
+    )
+    templated = timeit.timeit(
+        lambda: (
+            templates.url(API_CAMERAS),
+            templates.headers(access),
+            templates.timeout(API_TIMEOUT),
+        ),
+        number=number,
+    )
+    return ad_hoc * 1e6 / number, templated * 1e6 / number
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    server = FakeUfanet(FakeUfanetConfig(cameras=10, latency=args.latency))
+    url = await server.start()
+    hass = make_hass()
+    hub = make_hub(hass)
+    api = UfanetAPI(hass, "bench", "bench", hub, url, dedicated_transport=True)
+    api.coalesce_window = 0
+    try:
+        await hub.async_warm_up(url)
+        warm = hub.connections.as_dict()
+        await api.async_authenticate()
+        for _ in range(args.requests):
+            await api.async_get_cameras()
+        # Bursts need as many connections as requests in flight.
+        for _ in range(args.requests // 10):
+            await asyncio.gather(*(api.async_ping() for _ in range(4)))
+        stats = hub.connections.as_dict()
+    finally:
+        await api.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    ad_hoc, templated = build_costs(url)
+    print(f"warm-up opened {warm['created']} connections")
+    print(
+        f"{args.requests} sequential and {args.requests // 10} bursts of 4: "
+        f"{stats['created']} new, {stats['reused']} reused connections, "
+        f"reuse ratio {stats['reuse_ratio']}"
+    )
+    print(f"request build  ad hoc {ad_hoc:.2f} us, templated {templated:.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    asyncio.run(run(parser.parse_args()))
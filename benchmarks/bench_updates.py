@@ -0,0 +1,72 @@
+"""Entity updates per refresh when a few cameras change.
+
+Registers one listener per camera the way camera entities do and counts how
+many of them run when the fake server rotates some stream tokens. Run from
+the repository root:
+
+    python -m benchmarks.bench_updates --cameras 1000 5000 --changed 10
+"""
+
+import argparse
+import asyncio
+import time
+
+from ._common import make_coordinator, make_hass
+from .fake_ufanet import FakeUfanet, FakeUfanetConfig
+
+
+async def measure(cameras: int, changed: int, rounds: int) -> tuple[float, float]:
+    """Return listener calls and ms spent in them per refresh."""
+    server = FakeUfanet(FakeUfanetConfig(cameras=cameras))
+    url = await server.start()
+    hass = make_hass()
+    coordinator = make_coordinator(hass, url)
+    coordinator._phase = 0  # noqa: SLF001
+    calls = 0
+    spent = 0.0
+
+    def listener(number: str) -> None:
+        nonlocal calls
+        calls += 1
+        # Roughly what a state write reads.
+        camera = coordinator.records["cameras"][number]
+        _ = f"Ufanet {camera.address} {camera.title}", camera.rtsp_url
+
+    try:
+        await coordinator.async_refresh()
+        for number in coordinator.records["cameras"]:
+            coordinator.async_add_listener(
+                lambda number=number: listener(number), ("cameras", number)
+            )
+        for _ in range(rounds):
+            server.rotate_tokens(changed)
+            coordinator._last_fetch.clear()  # noqa: SLF001
+            calls_before = calls
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            spent += time.perf_counter() - start
+            assert calls - calls_before == changed, calls - calls_before
+    finally:
+        await coordinator.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+    return calls / rounds, spent * 1000 / rounds
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run benchmark."""
+    for cameras in args.cameras:
+        calls, ms = await measure(cameras, args.changed, args.rounds)
+        print(
+            f"{cameras:>6} cameras, {args.changed} changed: "
+            f"{calls:.0f} entity updates per refresh (was {cameras}), "
+            f"refresh {ms:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cameras", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
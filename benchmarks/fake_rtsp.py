@@ -0,0 +1,100 @@
+"""Local stand-in for the RTSP servers of Ufanet cameras.
+
+Answers OPTIONS and DESCRIBE with configurable latency, 404 for dead
+cameras, and can refuse connections like a server that is down. Run
+standalone with:
+
+    python -m benchmarks.fake_rtsp --port 8554 --latency 0.02
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+
+@dataclass
+class FakeRtspConfig:
+    """Behaviour of the fake RTSP server."""
+
+    latency: float = 0.0
+    dead: set[str] = field(default_factory=set)
+    requests: int = 0
+    connections: int = 0
+
+
+class FakeRtsp:
+    """asyncio RTSP responder that never sends media."""
+
+    def __init__(self, config: FakeRtspConfig | None = None) -> None:
+        """Initialize fake server."""
+        self.config = config or FakeRtspConfig()
+        self._server: asyncio.Server | None = None
+        self.port = 0
+
+    @property
+    def domain(self) -> str:
+        """Return host and port as used in camera rtsp urls."""
+        return f"127.0.0.1:{self.port}"
+
+    async def start(self, port: int = 0) -> str:
+        """Start listening, reusing the last port after a stop."""
+        self._server = await asyncio.start_server(
+            self._handle, "127.0.0.1", port or self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.domain
+
+    async def stop(self) -> None:
+        """Stop listening, new connections are refused."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests until the client hangs up."""
+        self.config.connections += 1
+        try:
+            while request := await reader.readuntil(b"\r\n\r\n"):
+                self.config.requests += 1
+                lines = request.decode("latin-1").split("\r\n")
+                method, url, _ = lines[0].split(" ", 2)
+                cseq = next(
+                    (line for line in lines if line.lower().startswith("cseq:")),
+                    "CSeq: 0",
+                )
+                if self.config.latency:
+                    await asyncio.sleep(self.config.latency)
+                number = urlsplit(url).path.strip("/")
+                if number in self.config.dead:
+                    status = "404 Not Found"
+                elif method in ("OPTIONS", "DESCRIBE"):
+                    status = "200 OK"
+                else:
+                    status = "405 Method Not Allowed"
+                writer.write(
+                    f"RTSP/1.0 {status}\r\n{cseq}\r\n"
+                    "Public: OPTIONS, DESCRIBE, SETUP, PLAY, TEARDOWN\r\n\r\n".encode()
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run fake server until interrupted."""
+    server = FakeRtsp(FakeRtspConfig(latency=args.latency))
+    print(f"Serving rtsp://{await server.start(args.port)}/")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8554)
+    parser.add_argument("--latency", type=float, default=0.0)
+    asyncio.run(_serve(parser.parse_args()))
@@ -0,0 +1,323 @@
+"""Local stand-in for dom.ufanet.ru.
+
+Serves the endpoints from const.py with configurable latency, payload size
+and error injection. Run standalone with:
+
+    python -m benchmarks.fake_ufanet --cameras 500 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import bisect
+from dataclasses import dataclass, field
+import random
+import time
+
+from aiohttp import web
+
+from custom_components.ufanet_intercom.const import (
+    API_AUTH,
+    API_CAMERAS,
+    API_CONTRACT,
+    API_EVENTS,
+    API_HISTORY,
+    API_INTERCOMS,
+    API_OPEN_DOOR,
+    API_REFRESH,
+)
+
+from .bench_models import make_cameras
+
+
+def make_intercoms(count: int) -> list[dict]:
+    """Return fake intercom payload."""
+    return [
+        {
+            "id": i,
+            "contract": None,
+            "role": {"id": 1, "name": "Житель"},
+            "camera": f"1{i:09d}",
+            "cctv_number": f"1{i:09d}",
+            "string_view": f"Уфа, ул. Ленина, {i}",
+            "timeout": 5,
+            "disable_button": False,
+            "no_sound": False,
+            "open_in_talk": "http",
+            "open_type": "http",
+            "dtmf_code": "#",
+            "inactivity_reason": None,
+            "house": i // 4,
+            "frsi": False,
+            "is_fav": i % 2 == 0,
+            "model": 1,
+            "custom_name": f"Подъезд {i}",
+            "is_blocked": False,
+            "supports_key_recording": False,
+            "ble_support": False,
+            "scope": "shared",
+        }
+        for i in range(count)
+    ]
+
+
+@dataclass
+class FakeUfanetConfig:
+    """Behaviour of the fake server."""
+
+    cameras: int = 100
+    intercoms: int = 4
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    token_ttl: int = 3600
+    etag: bool = True
+    events: bool = True
+    events_status: int = 200
+    events_body: str | None = None
+    history: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+
+
+class FakeUfanet:
+    """aiohttp application imitating the Ufanet API."""
+
+    def __init__(self, config: FakeUfanetConfig | None = None) -> None:
+        """Initialize fake server."""
+        self.config = config or FakeUfanetConfig()
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post(f"/{API_AUTH}", self._auth)
+        self.app.router.add_post(f"/{API_REFRESH}", self._auth)
+        self.app.router.add_get(f"/{API_INTERCOMS}", self._intercoms)
+        self.app.router.add_get(f"/{API_CAMERAS}", self._cameras)
+        self.app.router.add_get(f"/{API_CONTRACT}", self._contract)
+        self.app.router.add_get(f"/{API_EVENTS}", self._events)
+        self.app.router.add_get(f"/{API_HISTORY}", self._history)
+        self.app.router.add_get(
+            "/" + API_OPEN_DOOR.format(intercom_id="{intercom_id}"), self._open_door
+        )
+        self.app.router.add_route("HEAD", "/", self._ping)
+        self._runner: web.AppRunner | None = None
+        self._events_log: list[dict] = []
+        self._new_event = asyncio.Condition()
+        self._closing = False
+        self._history_log: list[dict] = []
+        self._issued: list[str] = []
+        self._revoked: set[str] = set()
+        self.url = ""
+        self.set_payload()
+        self.add_history(self.config.history, time.time() - 3 * 24 * 3600)
+
+    def set_payload(
+        self, cameras: int | None = None, intercoms: int | None = None
+    ) -> None:
+        """Regenerate payloads."""
+        if cameras is not None:
+            self.config.cameras = cameras
+        if intercoms is not None:
+            self.config.intercoms = intercoms
+        self._cameras = make_cameras(self.config.cameras)
+        self._bodies = {
+            API_CAMERAS: web.json_response(self._cameras).body,
+            API_INTERCOMS: web.json_response(
+                make_intercoms(self.config.intercoms)
+            ).body,
+        }
+
+    def rotate_tokens(self, count: int) -> None:
+        """Issue new stream tokens to the first count cameras."""
+        for camera in self._cameras[:count]:
+            camera["token_l"] = f"{random.getrandbits(128):032x}"
+        self._bodies[API_CAMERAS] = web.json_response(self._cameras).body
+
+    def revoke_tokens(self) -> None:
+        """Reject every access token issued so far."""
+        self._revoked.update(self._issued)
+
+    def add_history(self, count: int, start: float | None = None) -> None:
+        """Append count history records spread from start until now."""
+        now = time.time()
+        start = now if start is None else start
+        for i in range(count):
+            self._history_log.append(
+                {
+                    "id": len(self._history_log) + 1,
+                    "intercom": i % self.config.intercoms,
+                    "type": "door_opened" if i % 3 else "ring",
+                    "time": start + (now - start) * i / max(count, 1),
+                    "who": f"+7917{i % 10000:07d}" if i % 3 else None,
+                }
+            )
+
+    async def push_event(self, intercom: int, event_type: str = "ring") -> None:
+        """Publish an intercom event to waiting long-polls and history."""
+        async with self._new_event:
+            event = {"intercom": intercom, "type": event_type, "time": time.time()}
+            self._events_log.append(event)
+            self._history_log.append({"id": len(self._history_log) + 1, **event})
+            self._new_event.notify_all()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start server and return its base url."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}/"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop server."""
+        # Release held long-polls, cleanup waits for running handlers.
+        async with self._new_event:
+            self._closing = True
+            self._new_event.notify_all()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count requests, add latency and inject errors."""
+        route = request.match_info.route.resource
+        name = route.canonical if route else request.path
+        self.config.requests[name] = self.config.requests.get(name, 0) + 1
+        if delay := self.config.latency + random.uniform(0, self.config.jitter):
+            await asyncio.sleep(delay)
+        if request.method != "HEAD" and random.random() < self.config.error_rate:
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        return await handler(request)
+
+    def _authorized(self, request: web.Request) -> bool:
+        """Check authorization header."""
+        header = request.headers.get("Authorization", "")
+        return header.startswith("JWT ") and header[4:] not in self._revoked
+
+    async def _auth(self, request: web.Request) -> web.Response:
+        """Issue token."""
+        now = int(time.time())
+        serial = len(self._issued)
+        self._issued.append(f"access-{now}-{serial}")
+        return web.json_response(
+            {
+                "token": {
+                    "access": self._issued[-1],
+                    "refresh": f"refresh-{now}-{serial}",
+                    "exp": now + self.config.token_ttl,
+                }
+            }
+        )
+
+    def _payload(self, request: web.Request, key: str) -> web.Response:
+        """Return cached payload, honouring If-None-Match."""
+        if not self._authorized(request):
+            return web.Response(status=401)
+        body = self._bodies[key]
+        headers = {}
+        if self.config.etag:
+            etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304)
+            headers["ETag"] = etag
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _intercoms(self, request: web.Request) -> web.Response:
+        """Return intercoms."""
+        return self._payload(request, API_INTERCOMS)
+
+    async def _cameras(self, request: web.Request) -> web.Response:
+        """Return cameras."""
+        return self._payload(request, API_CAMERAS)
+
+    async def _contract(self, request: web.Request) -> web.Response:
+        """Return contracts."""
+        if not self._authorized(request):
+            return web.Response(status=401)
+        return web.json_response([{"id": 1, "title": "Договор 1", "balance": 250}])
+
+    async def _events(self, request: web.Request) -> web.Response:
+        """Hold the request until there are events after cursor."""
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if not self.config.events:
+            return web.Response(status=404)
+        if self.config.events_status != 200 or self.config.events_body is not None:
+            return web.Response(
+                status=self.config.events_status, text=self.config.events_body
+            )
+        if "cursor" not in request.query:
+            # First call only subscribes.
+            return web.json_response(
+                {"cursor": str(len(self._events_log)), "events": []}
+            )
+        cursor = int(request.query["cursor"])
+        hold = float(request.query.get("timeout", 60))
+        async with self._new_event:
+            try:
+                await asyncio.wait_for(
+                    self._new_event.wait_for(
+                        lambda: self._closing or len(self._events_log) > cursor
+                    ),
+                    hold,
+                )
+            except TimeoutError:
+                pass
+        return web.json_response(
+            {
+                "cursor": str(len(self._events_log)),
+                "events": self._events_log[cursor:],
+            }
+        )
+
+    async def _history(self, request: web.Request) -> web.Response:
+        """Return a page of history after cursor or since a time."""
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if "cursor" in request.query:
+            start = int(request.query["cursor"])
+        else:
+            since = float(request.query.get("since", 0))
+            start = bisect.bisect_left(
+                self._history_log, since, key=lambda record: record["time"]
+            )
+        end = start + int(request.query.get("limit", 100))
+        return web.json_response(
+            {
+                "cursor": str(min(end, len(self._history_log))),
+                "results": self._history_log[start:end],
+                "has_more": end < len(self._history_log),
+            }
+        )
+
+    async def _open_door(self, request: web.Request) -> web.Response:
+        """Open door."""
+        if not self._authorized(request):
+            return web.Response(status=401)
+        return web.json_response({"result": True})
+
+    async def _ping(self, request: web.Request) -> web.Response:
+        """Answer keepalive."""
+        return web.Response()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run fake server until interrupted."""
+    server = FakeUfanet(
+        FakeUfanetConfig(
+            cameras=args.cameras,
+            intercoms=args.intercoms,
+            latency=args.latency,
+            error_rate=args.error_rate,
+        )
+    )
+    print(f"Serving on {await server.start(port=args.port)}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cameras", type=int, default=100)
+    parser.add_argument("--intercoms", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    asyncio.run(_serve(parser.parse_args()))
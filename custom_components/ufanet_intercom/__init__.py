@@ -4,34 +4,70 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .const import CONF_DEDICATED_TRANSPORT, CONF_PROBE_CAMERAS, DOMAIN, PLATFORMS
 from .coordinator import UfanetDataCoordinator
+from .hub import async_get_hub
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up integration services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up My Intercom from a config entry."""
 
-    coordinator = UfanetDataCoordinator(hass, entry)
+    hub = async_get_hub(hass)
+    coordinator = UfanetDataCoordinator(hass, entry, hub)
+    if entry.options.get(CONF_DEDICATED_TRANSPORT, False):
+        # Connect while the snapshot loads, the first requests reuse the pool.
+        entry.async_create_background_task(
+            hass, hub.async_warm_up(coordinator.api.host), f"{DOMAIN} warm-up"
+        )
 
-    try:
+    # Entities are created from the last snapshot right away, live data
+    # arrives in the background. Without a snapshot we have to wait for it.
+    warm_start = await coordinator.async_load_snapshot()
+    if not warm_start:
         await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.error("Failed to setup integration: %s", err)
-        return False
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    coordinator.api.async_start()
+    coordinator.events.async_start()
+    coordinator.history.async_start()
+    if entry.options.get(CONF_PROBE_CAMERAS, False):
+        coordinator.prober.async_start(lambda: coordinator.cameras)
+
+    if warm_start:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
+        )
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload entry so cameras pick up new stream options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # The coordinator shuts itself down on unload.
+        hass.data[DOMAIN].pop(entry.entry_id)
         return unload_ok
     return False
@@ -1,25 +1,127 @@
 """API client for My Intercom integration."""
 
+import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import hashlib
+from http import HTTPStatus
 import logging
+import time
 from typing import Any
 from urllib.parse import urljoin
 
-from aiohttp import ClientSession
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    hdrs,
+)
 
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
+from .auth import TokenManager
 from .const import (
     API_AUTH,
+    API_COALESCE_WINDOW,
     API_CAMERAS,
     API_CONTRACT,
+    API_EVENTS,
+    API_HISTORY,
     API_INTERCOMS,
     API_OPEN_DOOR,
+    API_REFRESH,
+    API_RETRIES,
+    API_TIMEOUT,
+    BACKOFF_MAX,
     CONF_HOST,
+    DEFAULT_HOST,
+    EVENTS_HOLD_TIMEOUT,
+    HISTORY_PAGE_SIZE,
+    HUB_KEEPALIVE_TIMEOUT,
+    SHARED_KEEPALIVE_TIMEOUT,
+)
+from .exceptions import (
+    CircuitOpenUfanetIntercomAPIError,
+    ClientConnectorUfanetIntercomAPIError,
+    NotSupportedUfanetIntercomAPIError,
+    ServerUfanetIntercomAPIError,
+    TimeoutUfanetIntercomAPIError,
+    TooManyRequestsUfanetIntercomAPIError,
+    UfanetIntercomAPIError,
+    UnauthorizedUfanetIntercomAPIError,
+    UnknownUfanetIntercomAPIError,
 )
-from .exceptions import UfanetIntercomAPIError
-from .models import Contract, Intercom, Token, UCamera
+from .hub import UfanetHub
+from .metrics import ApiMetrics
+from .models import Contract, HistoryRecord, Intercom, Token, UCamera
+from .parsing import ModelParser
+from .resilience import CircuitBreaker, backoff_delay, parse_retry_after
+from .safe_logger import RedactingFilter
+from .transport import RequestTemplates
 
 _LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+# Errors worth retrying, the server may recover from them.
+TRANSIENT_ERRORS = (
+    ClientConnectorUfanetIntercomAPIError,
+    ServerUfanetIntercomAPIError,
+    TimeoutUfanetIntercomAPIError,
+    TooManyRequestsUfanetIntercomAPIError,
+)
+
+
+def _raise_for_status(response: ClientResponse) -> None:
+    """Raise mapped error for an error response."""
+    if response.status < 400:
+        return
+    retry_after = parse_retry_after(response.headers.get(hdrs.RETRY_AFTER))
+    message = f"{response.status} {response.reason} for {response.url.path}"
+    if response.status == HTTPStatus.UNAUTHORIZED:
+        raise UnauthorizedUfanetIntercomAPIError(message)
+    if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+        raise TooManyRequestsUfanetIntercomAPIError(message, retry_after=retry_after)
+    if response.status >= 500:
+        raise ServerUfanetIntercomAPIError(message, retry_after=retry_after)
+    if response.status in (HTTPStatus.NOT_FOUND, HTTPStatus.METHOD_NOT_ALLOWED):
+        # The backend has no such endpoint.
+        raise NotSupportedUfanetIntercomAPIError(message)
+    raise UnknownUfanetIntercomAPIError(message)
+
+
+@asynccontextmanager
+async def _map_errors():
+    """Map aiohttp errors to API errors."""
+    try:
+        yield
+    except UfanetIntercomAPIError:
+        raise
+    except TimeoutError as err:
+        raise TimeoutUfanetIntercomAPIError("Request timed out") from err
+    except ClientConnectionError as err:
+        raise ClientConnectorUfanetIntercomAPIError(str(err)) from err
+    except ClientError as err:
+        raise UnknownUfanetIntercomAPIError(str(err)) from err
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Last parsed response of an endpoint."""
+
+    etag: str | None
+    digest: bytes
+    value: Any
+    access: str | None = None
+    fetched: float = 0.0
+
+
+def _parse_contracts(data: list[dict[str, Any]]) -> list[Contract]:
+    """Parse contracts payload."""
+    return [Contract.model_validate(contract) for contract in data]
 
 
 class UfanetAPI:
@@ -30,81 +132,361 @@ class UfanetAPI:
         hass,
         contract: str,
         password: str,
+        hub: UfanetHub | None = None,
+        host: str = DEFAULT_HOST,
+        dedicated_transport: bool = False,
     ) -> None:
         """Initialize API client."""
         self.hass = hass
-        self._host = "https://dom.ufanet.ru/"
+        self._templates = RequestTemplates(host)
         self._contract = contract
         self._password = password
-        self._token: Token | None = None
-        self._session: ClientSession = async_get_clientsession(hass)
+        self._hub = hub
+        self._session: ClientSession = (
+            hub.async_get_session(dedicated_transport)
+            if hub
+            else async_get_clientsession(hass)
+        )
+        self._keepalive_timeout = (
+            HUB_KEEPALIVE_TIMEOUT
+            if hub and dedicated_transport
+            else SHARED_KEEPALIVE_TIMEOUT
+        )
+        self._tokens = TokenManager(hass, self._async_login, self._async_refresh)
+        self._responses: dict[str, _CachedResponse] = {}
+        self._inflight: dict[tuple[str, str | None], asyncio.Task[Any]] = {}
+        self.coalesce_window: float = API_COALESCE_WINDOW
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.metrics = ApiMetrics()
+        self._intercom_parser = ModelParser(Intercom, "id")
+        self._camera_parser = ModelParser(UCamera, "number")
+        self._camera_numbers: frozenset[str] | None = None
+
+    @property
+    def token(self) -> Token | None:
+        """Return current token."""
+        return self._tokens.token
+
+    @property
+    def session(self) -> ClientSession:
+        """Return session requests are sent with."""
+        return self._session
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """Return seconds an idle connection of the session stays open."""
+        return self._keepalive_timeout
+
+    @property
+    def host(self) -> str:
+        """Return API base url."""
+        return self._templates.host
+
+    @property
+    def breakers(self) -> dict[str, CircuitBreaker]:
+        """Return circuit breakers by endpoint."""
+        return self._breakers
+
+    def restore_token(self, token: Token) -> None:
+        """Reuse a previously issued token if it is still valid."""
+        if TokenManager.is_valid(token):
+            self._tokens.set_token(token)
+
+    @callback
+    def async_start(self) -> None:
+        """Keep the token fresh in the background, for long-lived clients."""
+        self._tokens.async_start()
 
     async def async_authenticate(self) -> bool:
         """Authenticate and get token."""
+        await self._tokens.async_login()
+        return True
+
+    async def _async_login(self) -> Token:
+        """Get new token by contract and password."""
         json = {"contract": self._contract, "password": self._password}
+        self.metrics.logins += 1
         try:
-            async with self._session.post(
-                f"{self._host}{API_AUTH}", json=json, timeout=30
+            async with _map_errors(), self._session.post(
+                self._templates.url(API_AUTH),
+                json=json,
+                timeout=self._templates.timeout(API_TIMEOUT),
             ) as response:
-                response.raise_for_status()
+                _raise_for_status(response)
                 data = await response.json()
-                self._token = Token(**data["token"])
-                return True
+                return Token(**data["token"])
         except Exception as err:
             _LOGGER.error("Error auth: %s", err)
             raise
 
+    async def _async_refresh(self, refresh: str) -> Token:
+        """Get new token by refresh token."""
+        self.metrics.token_refreshes += 1
+        async with _map_errors(), self._session.post(
+            self._templates.url(API_REFRESH),
+            json={"refresh": refresh},
+            timeout=self._templates.timeout(API_TIMEOUT),
+        ) as response:
+            _raise_for_status(response)
+            data = await response.json()
+            return Token(**data.get("token", data))
+
+    async def _async_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = API_TIMEOUT,
+        retries: int = 0,
+        metric: str | None = None,
+        params: dict[str, str] | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Perform request with backoff, guarded by the endpoint circuit breaker."""
+        if (breaker := self._breakers.get(endpoint)) is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint)
+        metrics = self.metrics.endpoint(metric or endpoint)
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            probe = False
+            try:
+                probe = breaker.before_request()
+                result = await self._async_send(
+                    method, endpoint, headers, timeout, params
+                )
+            except UfanetIntercomAPIError as err:
+                metrics.observe_error(time.monotonic() - start, err)
+                if not isinstance(err, TRANSIENT_ERRORS):
+                    if not isinstance(err, CircuitOpenUfanetIntercomAPIError):
+                        # The server answered, so it is up.
+                        breaker.record_success()
+                    raise
+                breaker.record_failure(err.retry_after)
+                delay = max(backoff_delay(attempt), breaker.remaining())
+                if attempt >= retries or delay > BACKOFF_MAX:
+                    raise
+                attempt += 1
+                _LOGGER.debug("Retrying %s in %.1fs: %s", endpoint, delay, err)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled or unexpected, must not leave the circuit half-open.
+                if probe:
+                    breaker.release_probe()
+                raise
+            metrics.observe_success(time.monotonic() - start, len(result[1]))
+            breaker.record_success()
+            return result
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None,
+        timeout: float,
+        params: dict[str, str] | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Send authorized request, re-authenticating once on 401."""
+        token = await self._tokens.async_get_token()
+        for attempt in range(2):
+            async with _map_errors(), self._session.request(
+                method,
+                self._templates.url(endpoint),
+                headers=self._templates.headers(token.access, headers),
+                params=params,
+                timeout=self._templates.timeout(timeout),
+            ) as response:
+                if response.status == HTTPStatus.UNAUTHORIZED and not attempt:
+                    token = await self._tokens.async_reauthenticate(token)
+                    continue
+                _raise_for_status(response)
+                return response, await response.read()
+        raise UfanetIntercomAPIError("Unreachable")
+
+    async def _async_get_parsed(
+        self, endpoint: str, parse: Callable[[Any], Any]
+    ) -> Any:
+        """GET endpoint and parse it, sharing the request with concurrent callers.
+
+        A result fetched with the same token within coalesce_window is
+        returned without a request.
+        """
+        access = token.access if (token := self.token) else None
+        cached = self._responses.get(endpoint)
+        if (
+            cached is not None
+            and cached.access == access
+            and time.monotonic() - cached.fetched < self.coalesce_window
+        ):
+            return cached.value
+
+        key = (endpoint, access)
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(self._async_fetch_parsed(endpoint, parse))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._inflight[key] = task
+        # Shielded, so one caller going away does not cancel the shared request.
+        return await asyncio.shield(task)
+
+    async def _async_fetch_parsed(
+        self, endpoint: str, parse: Callable[[Any], Any]
+    ) -> Any:
+        """GET endpoint and parse it, reusing the last result if unchanged.
+
+        Uses ETag when the server sends one and a digest of the body otherwise,
+        so an unchanged payload returns the very same object without parsing.
+        """
+        cached = self._responses.get(endpoint)
+        headers = None
+        if cached is not None and cached.etag:
+            headers = {hdrs.IF_NONE_MATCH: cached.etag}
+
+        if self._hub is not None:
+            await self._hub.limiter.acquire()
+        response, body = await self._async_request(
+            "GET", endpoint, headers, retries=API_RETRIES
+        )
+        access = token.access if (token := self.token) else None
+        if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            cached.access, cached.fetched = access, time.monotonic()
+            return cached.value
+
+        etag = response.headers.get(hdrs.ETAG)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if cached is not None and cached.digest == digest:
+            cached.etag = etag
+            cached.access, cached.fetched = access, time.monotonic()
+            return cached.value
+
+        value = parse(json_loads(body))
+        self._responses[endpoint] = _CachedResponse(
+            etag, digest, value, access, time.monotonic()
+        )
+        return value
+
     async def async_get_intercoms(self) -> list[Intercom]:
         """Get list of intercoms with RTSP URLs."""
-        if not self._token:
-            await self.async_authenticate()
         try:
-            async with self._session.get(
-                f"{self._host}{API_INTERCOMS}",
-                headers={"Authorization": f"JWT {self._token.access}"},
-                timeout=30,
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return [Intercom(**i) for i in data]
+            return await self._async_get_parsed(
+                API_INTERCOMS, self._intercom_parser.parse_list
+            )
         except Exception as err:
             _LOGGER.error("Error fetching intercoms list: %s", err)
             raise
 
+    def set_camera_filter(self, numbers: Iterable[str] | None) -> None:
+        """Keep only cameras with these numbers, None keeps all of them."""
+        numbers = frozenset(numbers) if numbers is not None else None
+        if numbers != self._camera_numbers:
+            self._camera_numbers = numbers
+            # The cached list was filtered with the old numbers.
+            self._responses.pop(API_CAMERAS, None)
+
     async def async_get_cameras(self) -> list[UCamera]:
         """Get list of intercoms with RTSP URLs."""
-        if not self._token:
-            await self.async_authenticate()
         try:
-            async with self._session.get(
-                f"{self._host}{API_CAMERAS}",
-                headers={"Authorization": f"JWT {self._token.access}"},
-                timeout=30,
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return [UCamera(**i) for i in data]
+            return await self._async_get_parsed(API_CAMERAS, self._parse_cameras)
         except Exception as err:
             _LOGGER.error("Error fetching cameras list: %s", err)
             raise
 
-    async def async_get_balance(self) -> float:
-        """Get balance."""
-        return 100
+    def _parse_cameras(self, data: list[dict[str, Any]]) -> list[UCamera]:
+        """Parse wanted cameras, reusing models other contracts already have."""
+        if (numbers := self._camera_numbers) is not None:
+            # Drop unwanted cameras before any model is built.
+            data = [i for i in data if i.get("number") in numbers]
+        if self._hub is None:
+            return self._camera_parser.parse_list(data)
+        parse = self._camera_parser.parse
+        cameras = [self._hub.intern_camera(i, parse) for i in data]
+        self._camera_parser.prune(data)
+        return cameras
 
-    async def async_open_door(self, intercom_id: str) -> bool:
+    async def async_get_contracts(self) -> list[Contract]:
+        """Get contracts with their balance in one request."""
+        try:
+            return await self._async_get_parsed(API_CONTRACT, _parse_contracts)
+        except Exception as err:
+            _LOGGER.error("Error fetching contracts: %s", err)
+            raise
+
+    async def async_get_events(
+        self, cursor: str | None = None, hold: float = EVENTS_HOLD_TIMEOUT
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """Wait for intercom events after cursor, return new cursor and events.
+
+        The server holds the request until an event happens or hold expires.
+        """
+        params = {"timeout": str(int(hold))}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response, body = await self._async_request(
+            "GET",
+            API_EVENTS,
+            timeout=hold + API_TIMEOUT,
+            params=params,
+        )
+        if response.status == HTTPStatus.NO_CONTENT or not body:
+            return cursor, []
+        try:
+            data = json_loads(body)
+        except ValueError as err:
+            raise UnknownUfanetIntercomAPIError(f"Invalid events: {err}") from err
+        if not isinstance(data, dict):
+            raise UnknownUfanetIntercomAPIError("Invalid events: not an object")
+        return data.get("cursor", cursor), data.get("events", [])
+
+    async def async_get_history(
+        self,
+        cursor: str | None = None,
+        since: float | None = None,
+        limit: int = HISTORY_PAGE_SIZE,
+    ) -> tuple[str | None, list[HistoryRecord], bool]:
+        """Get a page of call and door history after cursor, or since a time.
+
+        Returns the cursor of the next page, the records and whether more
+        records are waiting.
+        """
+        params = {"limit": str(limit)}
+        if cursor is not None:
+            params["cursor"] = cursor
+        elif since is not None:
+            params["since"] = str(int(since))
+        if self._hub is not None:
+            await self._hub.limiter.acquire()
+        _, body = await self._async_request(
+            "GET", API_HISTORY, retries=API_RETRIES, params=params
+        )
+        data = json_loads(body) if body else {}
+        return (
+            data.get("cursor", cursor),
+            [HistoryRecord.model_validate(item) for item in data.get("results", [])],
+            bool(data.get("has_more")),
+        )
+
+    async def async_open_door(
+        self, intercom_id: str, timeout: float = API_TIMEOUT
+    ) -> bool:
         """Send open door command to intercom."""
-        api_endpoint = f"{self._host}{API_OPEN_DOOR.format(intercom_id=intercom_id)}"
-        if not self._token:
-            await self.async_authenticate()
         try:
-            async with self._session.get(
-                api_endpoint,
-                headers={"Authorization": f"JWT {self._token.access}"},
-                timeout=30,
-            ) as response:
-                response.raise_for_status()
-                return True
+            await self._async_request(
+                "GET",
+                API_OPEN_DOOR.format(intercom_id=intercom_id),
+                timeout=timeout,
+                metric=API_OPEN_DOOR,
+            )
+            return True
         except Exception as err:
-            _LOGGER.error("Error fetching cameras list: %s", err)
+            _LOGGER.error("Error opening door %s: %s", intercom_id, err)
             raise
+
+    async def async_ping(self) -> None:
+        """Send a cheap request to keep the connection to the host open."""
+        async with self._session.head(
+            self._templates.url(), timeout=self._templates.timeout(10)
+        ):
+            pass
+
+    async def async_shutdown(self) -> None:
+        """Stop background token refresh."""
+        await self._tokens.async_shutdown()
@@ -0,0 +1,132 @@
+"""Token lifecycle for Ufanet API."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import TOKEN_EXPIRY_MARGIN, TOKEN_REFRESH_LEAD
+from .models import Token
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """Keep a valid token, refreshing it in the background before it expires.
+
+    Background refresh is armed by async_start, short-lived clients only
+    renew on demand.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        login: Callable[[], Awaitable[Token]],
+        refresh: Callable[[str], Awaitable[Token]],
+    ) -> None:
+        """Initialize token manager."""
+        self.hass = hass
+        self._login = login
+        self._refresh = refresh
+        self._token: Token | None = None
+        self._renew_task: asyncio.Task[Token] | None = None
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._background = False
+
+    @property
+    def token(self) -> Token | None:
+        """Return current token."""
+        return self._token
+
+    @staticmethod
+    def is_valid(token: Token | None, margin: float = TOKEN_EXPIRY_MARGIN) -> bool:
+        """Return True if token is usable for at least margin seconds."""
+        return token is not None and token.exp - time.time() > margin
+
+    @callback
+    def async_start(self) -> None:
+        """Refresh tokens in the background from now on."""
+        self._background = True
+        if self._token is not None:
+            self._schedule_refresh(self._token)
+
+    @callback
+    def set_token(self, token: Token) -> None:
+        """Store token and schedule its background refresh."""
+        self._token = token
+        if self._background:
+            self._schedule_refresh(token)
+
+    @callback
+    def _schedule_refresh(self, token: Token) -> None:
+        """Refresh token shortly before it expires."""
+        self._cancel_scheduled_refresh()
+        delay = token.exp - time.time() - TOKEN_REFRESH_LEAD
+        self._unsub_refresh = async_call_later(
+            self.hass, max(delay, 0), self._async_scheduled_refresh
+        )
+
+    async def async_get_token(self) -> Token:
+        """Return a valid token, renewing it if required."""
+        if self.is_valid(self._token):
+            return self._token
+        return await self._async_renew(login=False)
+
+    async def async_login(self) -> Token:
+        """Force a full login."""
+        return await self._async_renew(login=True)
+
+    async def async_reauthenticate(self, rejected: Token) -> Token:
+        """Renew token after the server rejected it."""
+        if self._token is not rejected and self.is_valid(self._token):
+            # Another caller already renewed it.
+            return self._token
+        return await self._async_renew(login=False)
+
+    async def _async_renew(self, login: bool) -> Token:
+        """Renew token, sharing one in-flight renewal between callers."""
+        if self._renew_task is None or self._renew_task.done():
+            self._renew_task = self.hass.async_create_background_task(
+                self._async_do_renew(login), name="ufanet_intercom token renew"
+            )
+        return await asyncio.shield(self._renew_task)
+
+    async def _async_do_renew(self, login: bool) -> Token:
+        """Refresh token by refresh token, falling back to full login."""
+        token: Token | None = None
+        refresh = self._token.refresh if self._token else None
+        if refresh and not login:
+            try:
+                token = await self._refresh(refresh)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Token refresh failed, logging in again: %s", err)
+        if token is None:
+            token = await self._login()
+        self.set_token(token)
+        return token
+
+    async def _async_scheduled_refresh(self, _now: datetime) -> None:
+        """Refresh token shortly before it expires."""
+        self._unsub_refresh = None
+        try:
+            await self._async_renew(login=False)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Background token refresh failed: %s", err)
+
+    @callback
+    def _cancel_scheduled_refresh(self) -> None:
+        """Cancel scheduled background refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refresh."""
+        self._background = False
+        self._cancel_scheduled_refresh()
+        if self._renew_task is not None and not self._renew_task.done():
+            self._renew_task.cancel()
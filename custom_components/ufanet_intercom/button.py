@@ -1,17 +1,20 @@
 """Ufanet door button."""
 
-import asyncio
+from datetime import datetime
 import logging
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import DOMAIN, DOOR_RESTORE_DELAY
 from .coordinator import UfanetDataCoordinator
+from .entity import UfanetRecordEntity
 from .models import Intercom
+from .reconciler import EntityReconciler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,26 +27,17 @@ async def async_setup_entry(
     """Set up camera platform."""
     coordinator: UfanetDataCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for initial data to be available
-    if not coordinator.data:
-        await coordinator.async_request_refresh()
-
-    intercoms = coordinator.data.get("intercoms", [])
-    entities = []
-
-    for intercom in intercoms:
-        if intercom.is_fav:
-            entities.append(UfanetButton(coordinator, intercom))
-            _LOGGER.debug(
-                "Created button for intercom %s ",
-                intercom.id,
-            )
-
-    _LOGGER.info("Setting up %d buttons", len(entities))
-    async_add_entities(entities)
+    reconciler = EntityReconciler(
+        coordinator,
+        async_add_entities,
+        "intercoms",
+        factory=lambda intercom: UfanetButton(coordinator, intercom),
+        include=lambda intercom: intercom.is_fav,
+    )
+    entry.async_on_unload(reconciler.async_start())
 
 
-class UfanetButton(CoordinatorEntity, ButtonEntity):
+class UfanetButton(UfanetRecordEntity, ButtonEntity):
     """Ufanet open_button."""
 
     entity_description = ButtonEntityDescription(
@@ -56,26 +50,75 @@ class UfanetButton(CoordinatorEntity, ButtonEntity):
 
     def __init__(self, coordinator: UfanetDataCoordinator, intercom: Intercom) -> None:
         """Init intercom button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "intercoms", intercom)
         ButtonEntity.__init__(self)
         self._coordinator = coordinator
-        self._intercom = intercom
         self._attr_unique_id = f"{intercom.id}_button"
-        self._attr_name = f"{intercom.custom_name} door button"
-        self._attr_available = True
+        self._press_failed = False
+        self._unsub_reset: CALLBACK_TYPE | None = None
+
+    @property
+    def name(self) -> str:
+        """Return name of the current intercom record."""
+        return f"{self.record.custom_name} door button"
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the connection warm while the button exists."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._coordinator.doors.async_register())
+        self.async_on_remove(self._cancel_reset)
+
+    @property
+    def available(self) -> bool:
+        """Return False for a while after a failed press."""
+        return super().available and not self._press_failed
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return open door latency stats."""
+        if stats := self._coordinator.doors.stats.get(self._record_key):
+            return stats.as_dict()
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Restore availability on successful refresh."""
+        if self.coordinator.last_update_success:
+            self._press_failed = False
+        super()._handle_coordinator_update()
 
     async def async_press(self) -> None:
         """Press button."""
+        self._coordinator.async_boost()
         try:
-            await self._coordinator.api.async_open_door(self._intercom.id)
+            await self._coordinator.doors.async_open(self._record_key)
+        except Exception as ex:
+            _LOGGER.error("Failed to open intercom %s: %s", self._record_key, ex)
+            self._press_failed = True
+            self._schedule_reset(DOOR_RESTORE_DELAY)
+        else:
             # Optional: provide feedback in UI
             self._attr_icon = "mdi:lock-open-check"
-            self.async_write_ha_state()
-            # Reset icon after delay
-            await asyncio.sleep(2)
-            self._attr_icon = "mdi:lock-open"
-            self.async_write_ha_state()
-        except Exception as ex:
-            _LOGGER.error("Failed to open intercom %s: %s", self._intercom.id, ex)
-            self._attr_available = False
-            self.async_write_ha_state()
+            self._schedule_reset(2)
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule_reset(self, delay: float) -> None:
+        """Reset icon and availability after delay."""
+        self._cancel_reset()
+        self._unsub_reset = async_call_later(self.hass, delay, self._async_reset)
+
+    @callback
+    def _async_reset(self, _now: datetime) -> None:
+        """Reset icon and availability."""
+        self._unsub_reset = None
+        self._attr_icon = "mdi:lock-open"
+        self._press_failed = False
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_reset(self) -> None:
+        """Cancel scheduled reset."""
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
@@ -9,16 +9,43 @@ from homeassistant.components.camera import (
     CameraEntityDescription,
     StreamType,
 )
+from homeassistant.components.camera.const import DATA_CAMERA_PREFS
+from homeassistant.components.stream import (
+    CONF_RTSP_TRANSPORT,
+    CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
+    Stream,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTR_CAMERA_NUMBER, ATTR_RTSP_URL, DOMAIN
+from .const import (
+    ATTR_CAMERA_NUMBER,
+    ATTR_PROBE_LATENCY,
+    ATTR_RTSP_URL,
+    CONF_LOW_LATENCY_CAMERAS,
+    CONF_PRELOAD_STREAMS,
+    DOMAIN,
+)
 from .coordinator import UfanetDataCoordinator
+from .entity import UfanetRecordEntity
 from .models import UCamera
+from .reconciler import EntityReconciler
+from .safe_logger import RedactingFilter
 
 _LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+# Entity registry option, set once the preload setting was turned on.
+PRELOAD_SEEDED = "preload_seeded"
+
+# Skip the UDP probe of ffmpeg and don't wait for camera timestamps.
+LOW_LATENCY_STREAM_OPTIONS = {
+    CONF_RTSP_TRANSPORT: "tcp",
+    CONF_USE_WALLCLOCK_AS_TIMESTAMPS: True,
+}
 
 
 async def async_setup_entry(
@@ -28,27 +55,34 @@ async def async_setup_entry(
 ) -> None:
     """Set up camera platform."""
     coordinator: UfanetDataCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    # Wait for initial data to be available
-    if not coordinator.data:
-        await coordinator.async_request_refresh()
-
-    cameras = coordinator.data.get("cameras", [])
-    entities = []
-
-    for camera in cameras:
-        entities.append(UfanetCamera(coordinator, camera))
-        _LOGGER.debug(
-            "Created camera %s with RTSP: %s",
-            camera.number,
-            camera.rtsp_url,
+    preload = entry.options.get(CONF_PRELOAD_STREAMS, False)
+    low_latency = set(entry.options.get(CONF_LOW_LATENCY_CAMERAS, []))
+
+    def _create(camera: UCamera) -> "UfanetCamera":
+        """Create camera entity with its stream options."""
+        favourites = {
+            number
+            for intercom in coordinator.intercoms
+            if intercom.is_fav
+            for number in (intercom.cctv_number, intercom.camera)
+        }
+        return UfanetCamera(
+            coordinator,
+            camera,
+            preload=preload and camera.number in favourites,
+            low_latency=camera.number in low_latency,
         )
 
-    _LOGGER.info("Setting up %d cameras", len(entities))
-    async_add_entities(entities)
+    reconciler = EntityReconciler(
+        coordinator,
+        async_add_entities,
+        "cameras",
+        factory=_create,
+    )
+    entry.async_on_unload(reconciler.async_start())
 
 
-class UfanetCamera(CoordinatorEntity, Camera):
+class UfanetCamera(UfanetRecordEntity, Camera):
     """Representation of an Intercom Camera using RTSP stream."""
 
     _attr_supported_features = CameraEntityFeature.STREAM
@@ -60,22 +94,50 @@ class UfanetCamera(CoordinatorEntity, Camera):
         icon="mdi:doorbell-video",
     )
 
-    def __init__(self, coordinator: UfanetDataCoordinator, camera: UCamera) -> None:
+    def __init__(
+        self,
+        coordinator: UfanetDataCoordinator,
+        camera: UCamera,
+        preload: bool = False,
+        low_latency: bool = False,
+    ) -> None:
         """Initialize the camera."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "cameras", camera)
         Camera.__init__(self)
+        self._preload = preload
+        if low_latency:
+            self.stream_options = dict(LOW_LATENCY_STREAM_OPTIONS)
 
         self._id = camera.number
-        self._camera_name = f"{camera.address} {camera.title}"
-        self._rtsp_url = camera.rtsp_url
-
-        self._attr_name = f"Ufanet {self._camera_name}"
         self._attr_unique_id = self._id
+        # Url the stream worker is running on.
+        self._rtsp_url = camera.rtsp_url
 
         # Camera attributes for better UI integration
         self._attr_brand = "Ufanet"
         self._attr_model = "RTSP Camera"
 
+    @property
+    def _camera(self) -> UCamera:
+        """Return current camera record."""
+        return self.record
+
+    @property
+    def name(self) -> str:
+        """Return name of the current camera record."""
+        return f"Ufanet {self._camera.address} {self._camera.title}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Move a running stream to a rotated url."""
+        if self.has_record:
+            rtsp_url = self._camera.rtsp_url
+            # A rotated token changes the url, the worker restarts on the new one.
+            if self.stream is not None and rtsp_url != self._rtsp_url:
+                self.stream.update_source(rtsp_url)
+            self._rtsp_url = rtsp_url
+        super()._handle_coordinator_update()
+
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         await super().async_added_to_hass()
@@ -84,24 +146,87 @@ class UfanetCamera(CoordinatorEntity, Camera):
             self._id,
             self._rtsp_url,
         )
+        if self._preload:
+            await self._async_seed_preload()
+
+    async def _async_seed_preload(self) -> None:
+        """Turn on the preload setting of a favourite camera, once.
+
+        The setting stays the user's, turned off later it is not turned on
+        again.
+        """
+        registry = er.async_get(self.hass)
+        if (entry := registry.async_get(self.entity_id)) is None:
+            return
+        options = entry.options.get(DOMAIN, {})
+        if options.get(PRELOAD_SEEDED):
+            return
+        registry.async_update_entity_options(
+            self.entity_id, DOMAIN, {**options, PRELOAD_SEEDED: True}
+        )
+        await self.hass.data[DATA_CAMERA_PREFS].async_update(
+            self.entity_id, preload_stream=True
+        )
+        if self.hass.state is not CoreState.running:
+            # The camera component preloads streams on start.
+            return
+        try:
+            if not (stream := await super().async_create_stream()):
+                return
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot preload stream of %s: %s", self._id, err)
+            return
+        stream.add_provider("hls")
+        await stream.start()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the stream worker."""
+        await super().async_will_remove_from_hass()
+        if self.stream is not None:
+            await self.stream.stop()
+
+    async def async_create_stream(self) -> Stream | None:
+        """Return the stream a viewer or recorder is about to start."""
+        # Keep the token in the url fresh while someone is watching.
+        self.coordinator.async_boost()
+        return await super().async_create_stream()
 
     async def stream_source(self) -> Optional[str]:
         """Return the RTSP stream source."""
+        if not self.has_record:
+            return None
+        self._rtsp_url = self._camera.rtsp_url
         return self._rtsp_url
 
     async def async_update(self) -> None:
         """Update camera entity - noop, updates handled by coordinator."""
         pass
 
+    @property
+    def available(self) -> bool:
+        """Return False while the stream does not answer RTSP probes."""
+        return super().available and self.coordinator.prober.available(self._id)
+
     @property
     def extra_state_attributes(self):
         """Return additional camera attributes."""
         return {
             ATTR_CAMERA_NUMBER: self._id,
-            ATTR_RTSP_URL: self._rtsp_url,
+            ATTR_RTSP_URL: self._camera.rtsp_url,
+            ATTR_PROBE_LATENCY: self.coordinator.prober.latency(self._id),
         }
 
-    @property
-    def use_stream_for_stills(self) -> bool:
-        """Use stream to generate stills."""
-        return True
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return still image from screenshot server, falling back to stream."""
+        if not self.has_record:
+            return None
+        if image := await self.coordinator.screenshots.async_get_image(self._camera):
+            return image
+        if not self.stream:
+            # A still is no viewer, polling is not boosted for it.
+            self.stream = await super().async_create_stream()
+        if self.stream:
+            return await self.stream.async_get_image(width=width, height=height)
+        return None
@@ -4,11 +4,32 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 
 from .api import UfanetAPI
-from .const import DOMAIN, CONF_HOST, CONF_CONTRACT, CONF_PASSWORD
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_CONTRACT,
+    CONF_CAMERA_ALLOW_LIST,
+    CONF_CAMERA_FILTER,
+    CONF_CAMERA_RADIUS,
+    CONF_DEDICATED_TRANSPORT,
+    CONF_DOOR_ROUTES,
+    CONF_LOW_LATENCY_CAMERAS,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_PASSWORD,
+    CONF_PRELOAD_STREAMS,
+    CONF_PROBE_CAMERAS,
+    CAMERA_FILTER_ALL,
+    CAMERA_FILTER_CONTRACT,
+    CAMERA_RADIUS_MAX,
+    CAMERAS_UPDATE_INTERVAL,
+    CONTRACTS_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -16,6 +37,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -29,8 +58,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     contract=user_input[CONF_CONTRACT],
                     password=user_input[CONF_PASSWORD],
                 )
-
-                await api.async_authenticate()
+                try:
+                    await api.async_authenticate()
+                finally:
+                    await api.async_shutdown()
 
                 await self.async_set_unique_id(user_input[CONF_CONTRACT])
                 self._abort_if_unique_id_configured()
@@ -52,3 +83,115 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
+
+
+def _parse_routes(text: str) -> dict[str, list[int]]:
+    """Parse "home: 1, 2, 3; garage: 4" into door routes."""
+    routes = {}
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        name, sep, ids = part.partition(":")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid door route {part}")
+        routes[name.strip()] = [int(i) for i in ids.split(",") if i.strip()]
+    return routes
+
+
+def _format_routes(routes: dict[str, list[int]]) -> str:
+    """Format door routes for editing."""
+    return "; ".join(
+        f"{name}: {', '.join(str(i) for i in ids)}" for name, ids in routes.items()
+    )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Ufanet options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage stream options."""
+        errors = {}
+        if user_input is not None:
+            # Allowed cameras may be hidden by the filter, so they are typed in.
+            user_input[CONF_CAMERA_ALLOW_LIST] = [
+                number.strip()
+                for number in user_input.get(CONF_CAMERA_ALLOW_LIST, "").split(",")
+                if number.strip()
+            ]
+            try:
+                user_input[CONF_DOOR_ROUTES] = _parse_routes(
+                    user_input.get(CONF_DOOR_ROUTES, "")
+                )
+            except ValueError:
+                errors[CONF_DOOR_ROUTES] = "invalid_routes"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        cameras = {}
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id):
+            cameras = {
+                camera.number: f"{camera.address} {camera.title}"
+                for camera in coordinator.cameras
+            }
+        options = self._entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_PRELOAD_STREAMS,
+                    default=options.get(CONF_PRELOAD_STREAMS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PROBE_CAMERAS,
+                    default=options.get(CONF_PROBE_CAMERAS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_DEDICATED_TRANSPORT,
+                    default=options.get(CONF_DEDICATED_TRANSPORT, False),
+                ): bool,
+                vol.Optional(
+                    CONF_CAMERA_FILTER,
+                    default=options.get(CONF_CAMERA_FILTER, CAMERA_FILTER_ALL),
+                ): vol.In([CAMERA_FILTER_ALL, CAMERA_FILTER_CONTRACT]),
+                vol.Optional(
+                    CONF_CAMERA_ALLOW_LIST,
+                    default=", ".join(options.get(CONF_CAMERA_ALLOW_LIST, [])),
+                ): str,
+                vol.Optional(
+                    CONF_CAMERA_RADIUS,
+                    default=options.get(CONF_CAMERA_RADIUS, 0),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=CAMERA_RADIUS_MAX)),
+                vol.Optional(
+                    CONF_LOW_LATENCY_CAMERAS,
+                    default=[
+                        number
+                        for number in options.get(CONF_LOW_LATENCY_CAMERAS, [])
+                        if number in cameras
+                    ],
+                ): cv.multi_select(cameras),
+                vol.Optional(
+                    CONF_DOOR_ROUTES,
+                    default=_format_routes(options.get(CONF_DOOR_ROUTES, {})),
+                ): str,
+                vol.Optional(
+                    CONF_MAX_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(
+                        min=CAMERAS_UPDATE_INTERVAL, max=CONTRACTS_UPDATE_INTERVAL
+                    ),
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
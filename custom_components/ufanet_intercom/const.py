@@ -4,25 +4,172 @@ from homeassistant.const import Platform
 from datetime import timedelta
 
 DOMAIN = "ufanet_intercom"
-PLATFORMS = [Platform.CAMERA, Platform.BUTTON]
+PLATFORMS = [Platform.CAMERA, Platform.BUTTON, Platform.EVENT, Platform.SENSOR]
 
 # Configuration
 CONF_HOST = "host"
 CONF_CONTRACT = "contract"
 CONF_PASSWORD = "password"
 
+# Options
+CONF_PRELOAD_STREAMS = "preload_streams"
+CONF_LOW_LATENCY_CAMERAS = "low_latency_cameras"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_CAMERA_FILTER = "camera_filter"
+CONF_CAMERA_ALLOW_LIST = "camera_allow_list"
+CAMERA_FILTER_ALL = "all"
+CAMERA_FILTER_CONTRACT = "contract"
+# Only cameras within this many meters of home, 0 keeps all of them
+CONF_CAMERA_RADIUS = "camera_radius"
+CAMERA_RADIUS_MAX = 50000
+# Named lists of intercom ids opened together by the open_doors service
+CONF_DOOR_ROUTES = "door_routes"
+# Check camera streams with RTSP OPTIONS in the background, off by default as
+# every probe is a connection to the provider's stream servers
+CONF_PROBE_CAMERAS = "probe_cameras"
+# Own connection pool for the Ufanet hosts instead of Home Assistant's shared one
+CONF_DEDICATED_TRANSPORT = "dedicated_transport"
+
 # Defaults
+DEFAULT_HOST = "https://dom.ufanet.ru/"
 DEFAULT_SCAN_INTERVAL = 30
 UPDATE_INTERVAL = 30
 
+# Per-endpoint refresh intervals (seconds). Intervals double while the data
+# stays unchanged, up to the configurable ceiling, and drop to the boost
+# interval for a while after someone opens a door or a stream.
+INTERCOMS_UPDATE_INTERVAL = 300
+CAMERAS_UPDATE_INTERVAL = 30
+CONTRACTS_UPDATE_INTERVAL = 3600
+DEFAULT_MAX_UPDATE_INTERVAL = 600
+BOOST_UPDATE_INTERVAL = 5
+BOOST_WINDOW = 120
+
+# Push events (seconds). While the event channel is healthy the coordinator
+# only needs to poll for camera tokens and contract data.
+EVENTS_HOLD_TIMEOUT = 60
+# Longest wait between reconnects, and rejected requests in a row before giving up
+EVENTS_RECONNECT_MAX = 300
+EVENTS_MAX_REJECTIONS = 5
+PUSH_UPDATE_INTERVAL = 120
+SIGNAL_INTERCOM_EVENT = f"{DOMAIN}_event_{{entry_id}}_{{intercom_id}}"
+EVENT_RING = "ring"
+EVENT_DOOR_OPENED = "door_opened"
+
+# Call and door history kept locally, synced incrementally (seconds)
+HISTORY_PAGE_SIZE = 200
+HISTORY_MAX_PAGES = 20
+HISTORY_MAX_RECORDS = 10000
+HISTORY_SYNC_INTERVAL = 900
+# The whole buffer is rewritten on save, syncs in between share one write
+HISTORY_SAVE_DELAY = 300
+HISTORY_INITIAL_WINDOW = 7 * 24 * 3600
+HISTORY_STORAGE_KEY = DOMAIN + ".history.{entry_id}"
+
+# Token lifecycle (seconds)
+TOKEN_REFRESH_LEAD = 300
+TOKEN_EXPIRY_MARGIN = 30
+
+# Retries and circuit breaker (seconds)
+API_TIMEOUT = 30
+API_RETRIES = 2
+# Concurrent and back-to-back reads of an endpoint within this window share
+# one request (seconds)
+API_COALESCE_WINDOW = 2
+BACKOFF_BASE = 1
+BACKOFF_MAX = 10
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30
+BREAKER_MAX_RESET_TIMEOUT = 600
+
+# Metrics, upper bounds of latency histogram buckets (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Log redaction limits
+LOG_REDACT_MAX_DEPTH = 4
+LOG_REDACT_MAX_ITEMS = 20
+LOG_REDACT_MAX_LENGTH = 2000
+
+# Shared hub
+DATA_HUB = f"{DOMAIN}_hub"
+HUB_CONNECTION_LIMIT = 20
+HUB_DNS_CACHE_TTL = 300
+HUB_KEEPALIVE_TIMEOUT = 60
+# Home Assistant's shared session closes idle connections after aiohttp's default
+SHARED_KEEPALIVE_TIMEOUT = 15
+# Connections opened to a host at startup, before the first request (seconds)
+HUB_WARMUP_CONNECTIONS = 2
+HUB_WARMUP_TIMEOUT = 10
+HUB_RATE_LIMIT = 5
+HUB_RATE_BURST = 10
+# Polls per hour shared by all entries, intervals stretch to fit
+HUB_POLL_BUDGET = 1800
+
+# Camera spatial index grid cell (meters)
+CAMERA_GRID_CELL = 500
+NEAREST_CAMERAS_DEFAULT = 5
+NEAREST_CAMERAS_MAX = 50
+
+# Services
+SERVICE_NEAREST_CAMERAS = "nearest_cameras"
+SERVICE_OPEN_DOORS = "open_doors"
+SERVICE_GET_HISTORY = "get_history"
+
+# Storage
+STORAGE_VERSION = 1
+STORAGE_KEY = DOMAIN + ".{entry_id}"
+SNAPSHOT_SAVE_DELAY = 10
+
 # API endpoints
 API_AUTH = "api/v1/auth/auth_by_contract/"
+API_REFRESH = "api/v1/auth/refresh/"
 API_INTERCOMS = "api/v0/skud/shared/"
 API_CAMERAS = "api/v1/cctv"
-API_CONTRACT = "/api/v0/contract"
+API_CONTRACT = "api/v0/contract"
+API_EVENTS = "api/v0/skud/shared/events/"
+API_HISTORY = "api/v0/skud/shared/history/"
 API_OPEN_DOOR = "api/v0/skud/shared/{intercom_id}/open/"
 
+# Screenshots
+SCREENSHOT_URL = "https://{domain}/api/v0/screenshots/{number}~600.jpg?token={token}"
+SCREENSHOT_CACHE_TTL = 10
+SCREENSHOT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+SCREENSHOT_TIMEOUT = 10
+
+# RTSP health probes (seconds). Failing cameras and unreachable servers are
+# probed less and less often, up to the max interval.
+RTSP_DEFAULT_PORT = 554
+RTSP_PROBE_TICK = 30
+RTSP_PROBE_INTERVAL = 300
+RTSP_PROBE_MAX_INTERVAL = 3600
+RTSP_PROBE_TIMEOUT = 5
+RTSP_PROBE_CONCURRENCY = 16
+RTSP_PROBE_PER_SERVER = 4
+
+# Door commands
+DOOR_ATTEMPT_TIMEOUT = 3
+DOOR_DEDUP_WINDOW = 3
+# Pings are sent this long before an idle pooled connection is closed (seconds)
+DOOR_KEEPALIVE_MARGIN = 5
+DOOR_LATENCY_SAMPLES = 50
+DOOR_RESTORE_DELAY = 30
+# open_doors service defaults, doors at once and overall deadline (seconds)
+DOOR_OPEN_PARALLEL = 4
+DOOR_OPEN_PARALLEL_MAX = 16
+DOOR_OPEN_DEADLINE = 10
+
 # Attributes
 ATTR_CAMERA_NUMBER = "intercom_id"
 ATTR_RTSP_URL = "rtsp_url"
+ATTR_PROBE_LATENCY = "probe_latency"
 ATTR_LAST_UPDATE = "last_update"
+ATTR_COUNT = "count"
+ATTR_MAX_DISTANCE = "max_distance"
+ATTR_INTERCOM_IDS = "intercom_ids"
+ATTR_ROUTE = "route"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_TIMEOUT = "timeout"
+ATTR_INTERCOM_ID = "intercom_id"
+ATTR_TYPES = "types"
+ATTR_HOURS = "hours"
+ATTR_LIMIT = "limit"
@@ -1,66 +1,384 @@
 """DataCoordinator Ufanet."""
 
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
 from datetime import timedelta
 import logging
+from operator import attrgetter
 import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import UfanetAPI
-from .const import DOMAIN, UPDATE_INTERVAL
-from .models import Intercom, UCamera
+from .const import (
+    BOOST_UPDATE_INTERVAL,
+    BOOST_WINDOW,
+    CAMERA_FILTER_ALL,
+    CAMERA_FILTER_CONTRACT,
+    CAMERA_RADIUS_MAX,
+    CAMERAS_UPDATE_INTERVAL,
+    CONTRACTS_UPDATE_INTERVAL,
+    CONF_CAMERA_ALLOW_LIST,
+    CONF_CAMERA_FILTER,
+    CONF_CAMERA_RADIUS,
+    CONF_DEDICATED_TRANSPORT,
+    CONF_HOST,
+    CONF_MAX_UPDATE_INTERVAL,
+    DEFAULT_HOST,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DOMAIN,
+    INTERCOMS_UPDATE_INTERVAL,
+    PUSH_UPDATE_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
+from .door import DoorOpener
+from .events import EventListener
+from .geo import CameraIndex
+from .history import HistoryStore
+from .hub import UfanetHub
+from .models import Contract, Intercom, Token, UCamera
+from .rtsp import CameraProber
+from .safe_logger import RedactingFilter
+from .screenshot import ScreenshotCache
 
 _LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+# Key of the records in every data list, entities listen by (list, key).
+RECORD_KEYS: dict[str, Callable[[Any], Hashable]] = {
+    "intercoms": attrgetter("id"),
+    "cameras": attrgetter("number"),
+    "contracts": attrgetter("id"),
+}
 
 
 class UfanetDataCoordinator(DataUpdateCoordinator):
     """Coordinator to manage data updates."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, hub: UfanetHub) -> None:
         """Initialize coordinator."""
         self.entry = entry
+        self.hub = hub
         self.api = UfanetAPI(
-            hass=hass, contract=entry.data["contract"], password=entry.data["password"]
+            hass=hass,
+            contract=entry.data["contract"],
+            password=entry.data["password"],
+            hub=hub,
+            host=entry.data.get(CONF_HOST, DEFAULT_HOST),
+            dedicated_transport=entry.options.get(CONF_DEDICATED_TRANSPORT, False),
         )
         self.intercoms: list[Intercom] = []
         self.cameras: list[UCamera] = []
+        self.contracts: list[Contract] = []
+        # A new dict per changed list, records keep their identity when unchanged.
+        self.records: dict[str, dict[Hashable, Any]] = {key: {} for key in RECORD_KEYS}
+        self._changed: set[tuple[str, Hashable]] = set()
+        self._notified_success = True
+        self.screenshots = ScreenshotCache(self.api.session)
+        self.doors = DoorOpener(hass, self.api)
+        self.events = EventListener(hass, entry, self.api, self._async_set_push_healthy)
+        self.history = HistoryStore(hass, entry, self.api)
+        self.prober = CameraProber(hass, entry, self._async_probed)
+
+        # Every endpoint is refreshed on its own interval, the coordinator
+        # interval is only the scheduling tick.
+        self._endpoints: dict[str, tuple[Callable[[], Awaitable[Any]], float]] = {
+            "intercoms": (self.api.async_get_intercoms, INTERCOMS_UPDATE_INTERVAL),
+            "cameras": (self._async_get_cameras, CAMERAS_UPDATE_INTERVAL),
+            "contracts": (self.api.async_get_contracts, CONTRACTS_UPDATE_INTERVAL),
+        }
+        self._last_fetch: dict[str, float] = {}
+        self._intervals = {key: base for key, (_, base) in self._endpoints.items()}
+        self._max_interval: float = entry.options.get(
+            CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        )
+        self._camera_filter = entry.options.get(CONF_CAMERA_FILTER, CAMERA_FILTER_ALL)
+        self._camera_allow_list = entry.options.get(CONF_CAMERA_ALLOW_LIST, [])
+        self._camera_radius: float = min(
+            entry.options.get(CONF_CAMERA_RADIUS, 0), CAMERA_RADIUS_MAX
+        )
+        # Rebuilt only when the API hands out a new camera list.
+        self.camera_index = CameraIndex([])
+        self._all_cameras: list[UCamera] | None = None
+        self._nearby_cameras: list[UCamera] = []
+        self._boost_until = 0.0
+        self._push_healthy = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        self._saved_token: Token | None = None
+        # Shifts this entry's polls so contracts don't hit the API at once.
+        self._phase = hub.async_register()
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Unchanged payloads come back as the same objects, so listeners
+            # are only notified when something actually changed.
+            always_update=False,
+        )
+
+    async def async_load_snapshot(self) -> bool:
+        """Restore last good data and token from storage."""
+        if not (stored := await self._store.async_load()):
+            return False
+        try:
+            if stored.get("token"):
+                self._saved_token = Token(**stored["token"])
+                self.api.restore_token(self._saved_token)
+            self.intercoms = [Intercom(**i) for i in stored["intercoms"]]
+            self.cameras = [UCamera(**i) for i in stored["cameras"]]
+            self.contracts = [Contract(**i) for i in stored.get("contracts", [])]
+            self.camera_index = CameraIndex(self.cameras)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Ignoring invalid snapshot: %s", err)
+            return False
+
+        for key, items in (
+            ("intercoms", self.intercoms),
+            ("cameras", self.cameras),
+            ("contracts", self.contracts),
+        ):
+            self._index_records(key, items)
+        # No entities exist yet.
+        self._changed.clear()
+
+        self.data = {
+            "intercoms": self.intercoms,
+            "cameras": self.cameras,
+            "contracts": self.contracts,
+            "last_update": stored.get("last_update"),
+        }
+        _LOGGER.debug(
+            "Restored %d intercoms and %d cameras from snapshot",
+            len(self.intercoms),
+            len(self.cameras),
         )
+        return True
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Schedule saving current data and token."""
+        self._saved_token = self.api.token
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return data to store."""
+        token = self.api.token
+        return {
+            "intercoms": [i.model_dump() for i in self.intercoms],
+            "cameras": [c.model_dump(exclude={"rtsp_url"}) for c in self.cameras],
+            "contracts": [c.model_dump() for c in self.contracts],
+            "last_update": self.data.get("last_update") if self.data else None,
+            "token": token.model_dump() if token else None,
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes, stop token renewal and release the hub.
+
+        Called by the config entry on unload.
+        """
+        await super().async_shutdown()
+        await self.events.async_stop()
+        await self.history.async_stop()
+        await self.prober.async_stop()
+        await self.api.async_shutdown()
+        self.hub.async_set_poll_rate(self.entry.entry_id, 0)
+        await self.hub.async_unregister()
+
+    async def _async_get_cameras(self) -> list[UCamera]:
+        """Fetch cameras, only the contract's ones in contract filter mode."""
+        if self._camera_filter == CAMERA_FILTER_CONTRACT:
+            if not (intercoms := self.intercoms):
+                # First refresh, shares the request of the intercoms endpoint.
+                intercoms = await self.api.async_get_intercoms()
+            self.api.set_camera_filter(
+                {
+                    number
+                    for intercom in intercoms
+                    for number in (intercom.cctv_number, intercom.camera)
+                    if number
+                }.union(self._camera_allow_list)
+            )
+        cameras = await self.api.async_get_cameras()
+        if cameras is not self._all_cameras:
+            self._all_cameras = cameras
+            self.camera_index = CameraIndex(cameras)
+            self._nearby_cameras = self._select_nearby(cameras)
+        return self._nearby_cameras
+
+    def _select_nearby(self, cameras: list[UCamera]) -> list[UCamera]:
+        """Return cameras within the configured radius of home."""
+        if not self._camera_radius:
+            return cameras
+        nearby = self.camera_index.within(
+            self.hass.config.latitude, self.hass.config.longitude, self._camera_radius
+        )
+        # Keep the API order, entity creation order stays stable.
+        numbers = {camera.number for camera in nearby}
+        numbers.update(self._camera_allow_list)
+        return [camera for camera in cameras if camera.number in numbers]
+
+    def _index_records(self, data_key: str, items: Iterable[Any]) -> None:
+        """Index a data list by record key and note which records changed."""
+        key = RECORD_KEYS[data_key]
+        old = self.records[data_key]
+        new = {key(item): item for item in items}
+        for record_key, item in new.items():
+            previous = old.get(record_key)
+            if previous is not item and previous != item:
+                self._changed.add((data_key, record_key))
+        self._changed.update((data_key, record_key) for record_key in old.keys() - new)
+        self.records[data_key] = new
 
-    async def async_authenticate(self):
-        """Perform authentication and update config entry."""
-        await self.api.async_authenticate()
-        # Update config entry with new token
-        hass = self.hass
-        new_data = {**self.entry.data}
-        new_data["token"] = self.api.token
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners of changed records and listeners of all data."""
+        changed: set[tuple[str, Hashable]] | None
+        changed, self._changed = self._changed, set()
+        if self.last_update_success != self._notified_success:
+            # Availability of every entity flips.
+            self._notified_success = self.last_update_success
+            changed = None
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or changed is None or context in changed:
+                update_callback()
 
-        hass.config_entries.async_update_entry(self.entry, data=new_data)
+    @callback
+    def async_update_records(self, data_key: str, keys: set[Hashable]) -> None:
+        """Update listeners of records whose derived state changed."""
+        for update_callback, context in list(self._listeners.values()):
+            if context is not None and context[0] == data_key and context[1] in keys:
+                update_callback()
 
-        _LOGGER.debug("Authentication successful")
+    @callback
+    def _async_probed(self, numbers: set[str]) -> None:
+        """Write state of cameras whose availability changed."""
+        self.async_update_records("cameras", numbers)
+
+    @callback
+    def _async_set_push_healthy(self, healthy: bool) -> None:
+        """Poll less often while intercom events arrive by push."""
+        self._push_healthy = healthy
+
+    @callback
+    def async_boost(self) -> None:
+        """Poll fast for a while, someone is using the intercom."""
+        now = time.monotonic()
+        boosting = now < self._boost_until
+        self._boost_until = now + BOOST_WINDOW
+        for key in ("intercoms", "cameras"):
+            self._intervals[key] = self._endpoints[key][1]
+        if not boosting:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _planned_interval(self, key: str, now: float) -> float:
+        """Return refresh interval of an endpoint before the budget applies."""
+        interval = self._intervals[key]
+        if key != "contracts":
+            if now < self._boost_until:
+                return BOOST_UPDATE_INTERVAL
+            if self._push_healthy:
+                interval = max(interval, PUSH_UPDATE_INTERVAL)
+        return interval
+
+    def _interval(self, key: str, now: float) -> float:
+        """Return current refresh interval of an endpoint."""
+        return self._planned_interval(key, now) * self.hub.poll_scale
+
+    def _due_endpoints(self, now: float) -> list[str]:
+        """Return endpoints whose refresh interval has elapsed."""
+        return [
+            key
+            for key in self._endpoints
+            if key not in self._last_fetch
+            or now - self._last_fetch[key] >= self._interval(key, now)
+        ]
+
+    @callback
+    def _async_plan(self, now: float) -> None:
+        """Share planned poll rate with the hub and tick when the next poll is due."""
+        self.hub.async_set_poll_rate(
+            self.entry.entry_id,
+            sum(1 / self._planned_interval(key, now) for key in self._endpoints),
+        )
+        intervals = {key: self._interval(key, now) for key in self._endpoints}
+        floor = BOOST_UPDATE_INTERVAL if now < self._boost_until else UPDATE_INTERVAL
+        next_due = min(
+            self._last_fetch.get(key, now) + interval - now
+            for key, interval in intervals.items()
+        )
+        self.update_interval = timedelta(seconds=max(floor, next_due))
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API - только баланс, камеры обновляются отдельно."""
+        """Fetch due endpoints concurrently, keeping last good data on failure."""
+        if self._phase and self.data is not None:
+            # First poll after setup, later ones keep the offset.
+            phase, self._phase = self._phase, 0
+            await asyncio.sleep(phase)
+
+        now = time.monotonic()
         try:
-            intercoms_data = await self.api.async_get_intercoms()
-            cameras_data = await self.api.async_get_cameras()
-            balance_data = await self.api.async_get_balance()
-
-            return {
-                "intercoms": intercoms_data,
-                "cameras": cameras_data,
-                "balance": balance_data,
-                "last_update": time.time(),
-            }
-
-        except Exception as err:
-            _LOGGER.error("Error updating data: %s", err)
-            raise
+            return await self._async_update_due(now)
+        finally:
+            self._async_plan(time.monotonic())
+
+    async def _async_update_due(self, now: float) -> dict[str, Any]:
+        """Fetch due endpoints."""
+        due = self._due_endpoints(now)
+        if not due:
+            return self.data
+
+        data = dict(self.data or {"intercoms": [], "cameras": [], "contracts": []})
+
+        results = await asyncio.gather(
+            *(self._endpoints[key][0]() for key in due), return_exceptions=True
+        )
+
+        errors: dict[str, BaseException] = {}
+        changed = False
+        for key, result in zip(due, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Error updating %s: %s", key, result)
+                errors[key] = result
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            base = self._endpoints[key][1]
+            if data[key] is result:
+                # Unchanged, back off up to the ceiling.
+                self._intervals[key] = max(
+                    base, min(self._intervals[key] * 2, self._max_interval)
+                )
+            else:
+                changed = True
+                self._intervals[key] = base
+                self._index_records(key, result)
+            data[key] = result
+            self._last_fetch[key] = now
+
+        # Failed endpoints stay due, the refresh fails when every poll failed.
+        if len(errors) == len(due):
+            raise UpdateFailed(f"Error updating data: {errors}")
+
+        if not changed and self.data is not None:
+            if self.api.token is not self._saved_token:
+                self._async_save_snapshot()
+            return self.data
+
+        self.intercoms = data["intercoms"]
+        self.cameras = data["cameras"]
+        self.contracts = data["contracts"]
+        data["last_update"] = time.time()
+        self._async_save_snapshot()
+        return data
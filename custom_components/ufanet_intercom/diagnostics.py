@@ -0,0 +1,64 @@
+"""Diagnostics support for Ufanet intercom."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN
+from .coordinator import UfanetDataCoordinator
+from .safe_logger import SafeLogger
+
+# Camera tokens and stream urls grant access to video, the entry title and
+# unique id hold the contract number.
+TO_REDACT = SafeLogger.SENSITIVE_KEYS | {
+    "contract",
+    "title",
+    "unique_id",
+    "token",
+    "token_l",
+    "token_r",
+    "rtsp_url",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: UfanetDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+    return async_redact_data(
+        {
+            "entry": entry.as_dict(),
+            "coordinator": {
+                "last_update_success": coordinator.last_update_success,
+                "last_update": (coordinator.data or {}).get("last_update"),
+                "intercoms": len(coordinator.intercoms),
+                "cameras": len(coordinator.cameras),
+                "indexed_cameras": len(coordinator.camera_index),
+                "contracts": len(coordinator.contracts),
+            },
+            "api": api.metrics.as_dict(),
+            "breakers": {
+                name: {"open": breaker.is_open, "remaining": breaker.remaining()}
+                for name, breaker in api.breakers.items()
+            },
+            "doors": {
+                door: stats.as_dict() for door, stats in coordinator.doors.stats.items()
+            },
+            "screenshots": coordinator.screenshots.as_dict(),
+            "events": coordinator.events.as_dict(),
+            "history": coordinator.history.as_dict(),
+            "rtsp_probes": coordinator.prober.as_dict(),
+            "connections": {
+                "dedicated": api.session is not async_get_clientsession(hass),
+                **coordinator.hub.connections.as_dict(),
+            },
+            "intercoms": [i.model_dump() for i in coordinator.intercoms],
+            "cameras": [c.model_dump() for c in coordinator.cameras],
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,198 @@
+"""Open door command path for Ufanet intercoms."""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import UfanetAPI
+from .const import (
+    DOOR_ATTEMPT_TIMEOUT,
+    DOOR_DEDUP_WINDOW,
+    DOOR_KEEPALIVE_MARGIN,
+    DOOR_LATENCY_SAMPLES,
+)
+from .exceptions import (
+    ClientConnectorUfanetIntercomAPIError,
+    TimeoutUfanetIntercomAPIError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DoorStats:
+    """Press-to-response latency of one intercom."""
+
+    presses: int = 0
+    failures: int = 0
+    last_latency: float | None = None
+    samples: deque[float] = field(
+        default_factory=lambda: deque(maxlen=DOOR_LATENCY_SAMPLES)
+    )
+
+    def percentile(self, pct: float) -> float | None:
+        """Return latency percentile in seconds."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return stats as state attributes."""
+        return {
+            "presses": self.presses,
+            "failures": self.failures,
+            "last_latency": self.last_latency,
+            "latency_p50": self.percentile(50),
+            "latency_p95": self.percentile(95),
+        }
+
+
+class DoorOpener:
+    """Send open door commands with deduplication and a tight deadline."""
+
+    def __init__(self, hass: HomeAssistant, api: UfanetAPI) -> None:
+        """Initialize door opener."""
+        self.hass = hass
+        self._api = api
+        self._inflight: dict[int, asyncio.Task[bool]] = {}
+        self._last_open: dict[int, float] = {}
+        self.stats: dict[int, DoorStats] = {}
+        self._users = 0
+        self._unsub_keepalive: CALLBACK_TYPE | None = None
+
+    async def async_open(self, intercom_id: int) -> bool:
+        """Open door, collapsing repeated presses on the same intercom."""
+        if (task := self._inflight.get(intercom_id)) is None:
+            opened = self._last_open.get(intercom_id)
+            if opened is not None and time.monotonic() - opened < DOOR_DEDUP_WINDOW:
+                _LOGGER.debug("Door %s was just opened, skipping", intercom_id)
+                return True
+            task = self.hass.async_create_task(
+                self._async_open(intercom_id), f"ufanet_intercom open {intercom_id}"
+            )
+            task.add_done_callback(lambda t: self._async_done(intercom_id, t))
+            self._inflight[intercom_id] = task
+        return await asyncio.shield(task)
+
+    @callback
+    def _async_done(self, intercom_id: int, task: asyncio.Task[bool]) -> None:
+        """Forget finished open, its waiters may be gone after a deadline."""
+        self._inflight.pop(intercom_id, None)
+        if not task.cancelled():
+            # Failures are logged by the API and returned to live waiters.
+            task.exception()
+
+    async def _async_open(self, intercom_id: int) -> bool:
+        """Open door with one fast retry on transient errors."""
+        stats = self.stats.setdefault(intercom_id, DoorStats())
+        stats.presses += 1
+        start = time.monotonic()
+        try:
+            try:
+                await self._api.async_open_door(
+                    intercom_id, timeout=DOOR_ATTEMPT_TIMEOUT
+                )
+            except (
+                ClientConnectorUfanetIntercomAPIError,
+                TimeoutUfanetIntercomAPIError,
+            ) as err:
+                _LOGGER.debug("Retrying open door %s: %s", intercom_id, err)
+                await self._api.async_open_door(
+                    intercom_id, timeout=DOOR_ATTEMPT_TIMEOUT
+                )
+        except Exception:
+            stats.failures += 1
+            raise
+        finished = time.monotonic()
+        stats.last_latency = finished - start
+        stats.samples.append(stats.last_latency)
+        self._last_open[intercom_id] = finished
+        return True
+
+    @callback
+    def async_register(self) -> CALLBACK_TYPE:
+        """Keep the connection warm while there are door buttons."""
+        self._users += 1
+        if self._unsub_keepalive is None:
+            # Ping before the session closes the idle connection.
+            interval = self._api.keepalive_timeout - DOOR_KEEPALIVE_MARGIN
+            self._unsub_keepalive = async_track_time_interval(
+                self.hass,
+                self._async_keepalive,
+                timedelta(seconds=interval),
+                name="ufanet_intercom keepalive",
+            )
+
+        @callback
+        def _unregister() -> None:
+            self._users -= 1
+            if not self._users and self._unsub_keepalive is not None:
+                self._unsub_keepalive()
+                self._unsub_keepalive = None
+
+        return _unregister
+
+    async def _async_keepalive(self, _now: datetime) -> None:
+        """Send a cheap request so the next press reuses an open connection."""
+        if self._inflight:
+            return
+        try:
+            await self._api.async_ping()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Keepalive failed: %s", err)
+
+
+async def async_open_doors(
+    doors: Iterable[tuple[DoorOpener, int]], parallel: int, deadline: float
+) -> list[dict[str, Any]]:
+    """Open doors concurrently, at most parallel at once, within deadline.
+
+    Returns success, latency and error of every door in the given order.
+    """
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def _async_open(
+        opener: DoorOpener, intercom_id: int, result: dict[str, Any]
+    ) -> None:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await opener.async_open(intercom_id)
+            except Exception as err:  # noqa: BLE001
+                result["error"] = str(err) or type(err).__name__
+            else:
+                result["success"] = True
+            result["latency"] = round(time.monotonic() - start, 3)
+
+    results: list[dict[str, Any]] = []
+    tasks: list[asyncio.Task[None]] = []
+    for opener, intercom_id in doors:
+        result = {
+            "intercom_id": intercom_id,
+            "success": False,
+            "latency": None,
+            "error": None,
+        }
+        results.append(result)
+        tasks.append(asyncio.create_task(_async_open(opener, intercom_id, result)))
+    if not tasks:
+        return results
+
+    _, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        # The open itself is shielded and may still finish.
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for result in results:
+        if not result["success"] and result["error"] is None:
+            result["error"] = "timeout"
+    return results
@@ -0,0 +1,51 @@
+"""Base entity for Ufanet intercom records."""
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import RECORD_KEYS, UfanetDataCoordinator
+
+
+class UfanetRecordEntity(CoordinatorEntity[UfanetDataCoordinator]):
+    """Entity of one coordinator record, updated only when that record changes.
+
+    Reads the live record by key instead of keeping a copy of it. Once the
+    record is gone the last one is kept, so properties stay readable until
+    the entity is removed.
+    """
+
+    def __init__(
+        self, coordinator: UfanetDataCoordinator, data_key: str, record: Any
+    ) -> None:
+        """Listen to changes of one record."""
+        self._data_key = data_key
+        self._record_key = RECORD_KEYS[data_key](record)
+        self._record = record
+        super().__init__(coordinator, context=(data_key, self._record_key))
+
+    @property
+    def has_record(self) -> bool:
+        """Return True while the record is in coordinator data."""
+        return self._record_key in self.coordinator.records[self._data_key]
+
+    @property
+    def record(self) -> Any:
+        """Return current record, the last known one once it is gone."""
+        if (
+            record := self.coordinator.records[self._data_key].get(self._record_key)
+        ) is not None:
+            self._record = record
+        return self._record
+
+    @property
+    def available(self) -> bool:
+        """Return True while the record exists and data is fresh."""
+        return super().available and self.has_record
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the record is gone, the entity is being removed."""
+        if self.has_record:
+            super()._handle_coordinator_update()
@@ -0,0 +1,86 @@
+"""Ufanet intercom events."""
+
+import logging
+from typing import Any
+
+from homeassistant.components.event import (
+    EventDeviceClass,
+    EventEntity,
+    EventEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, EVENT_DOOR_OPENED, EVENT_RING, SIGNAL_INTERCOM_EVENT
+from .coordinator import UfanetDataCoordinator
+from .entity import UfanetRecordEntity
+from .models import Intercom
+from .reconciler import EntityReconciler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up event platform."""
+    coordinator: UfanetDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    reconciler = EntityReconciler(
+        coordinator,
+        async_add_entities,
+        "intercoms",
+        factory=lambda intercom: UfanetIntercomEvent(coordinator, intercom),
+        include=lambda intercom: intercom.is_fav,
+    )
+    entry.async_on_unload(reconciler.async_start())
+
+
+class UfanetIntercomEvent(UfanetRecordEntity, EventEntity):
+    """Doorbell rings and door openings of an intercom."""
+
+    entity_description = EventEntityDescription(
+        key="event",
+        device_class=EventDeviceClass.DOORBELL,
+        event_types=[EVENT_RING, EVENT_DOOR_OPENED],
+    )
+
+    def __init__(self, coordinator: UfanetDataCoordinator, intercom: Intercom) -> None:
+        """Init intercom event."""
+        super().__init__(coordinator, "intercoms", intercom)
+        self._attr_unique_id = f"{intercom.id}_event"
+
+    @property
+    def name(self) -> str:
+        """Return name of the current intercom record."""
+        return f"{self.record.custom_name} Doorbell"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to events of this intercom."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_INTERCOM_EVENT.format(
+                    entry_id=self.coordinator.entry.entry_id,
+                    intercom_id=self._record_key,
+                ),
+                self._async_handle_event,
+            )
+        )
+
+    @callback
+    def _async_handle_event(self, event: dict[str, Any]) -> None:
+        """Fire the event right away."""
+        if (event_type := event.get("type")) not in self.event_types:
+            _LOGGER.debug("Ignoring %s event of %s", event_type, self._record_key)
+            return
+        if event_type == EVENT_RING:
+            # Someone is at the door, camera and door state will be needed.
+            self.coordinator.async_boost()
+        self._trigger_event(event_type, {k: v for k, v in event.items() if k != "type"})
+        self.async_write_ha_state()
@@ -0,0 +1,148 @@
+"""Long-poll listener for Ufanet intercom events."""
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .api import UfanetAPI
+from .const import EVENTS_MAX_REJECTIONS, EVENTS_RECONNECT_MAX, SIGNAL_INTERCOM_EVENT
+from .exceptions import (
+    NotSupportedUfanetIntercomAPIError,
+    UnknownUfanetIntercomAPIError,
+)
+from .resilience import backoff_delay
+from .safe_logger import RedactingFilter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+
+class EventListener:
+    """Receive intercom events and dispatch them to entities as they arrive."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: UfanetAPI,
+        on_health: Callable[[bool], None],
+    ) -> None:
+        """Initialize listener."""
+        self.hass = hass
+        self._entry = entry
+        self._api = api
+        self._on_health = on_health
+        self._task: asyncio.Task[None] | None = None
+        self._cursor: str | None = None
+        self.healthy = False
+        self.supported = True
+        self.events = 0
+        self.reconnects = 0
+        self.last_delay: float | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = self._entry.async_create_background_task(
+                self.hass,
+                self._async_listen(),
+                f"ufanet_intercom events {self._entry.entry_id}",
+            )
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+        if (task := self._task) is None:
+            return
+        self._task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self._set_healthy(False)
+
+    async def _async_listen(self) -> None:
+        """Poll events forever, backing off while the channel is broken."""
+        attempt = 0
+        rejections = 0
+        while True:
+            try:
+                self._cursor, events = await self._api.async_get_events(self._cursor)
+            except NotSupportedUfanetIntercomAPIError as err:
+                # The backend has no event channel, stay on polling.
+                _LOGGER.info("Intercom events are not available: %s", err)
+                self._stop()
+                return
+            except UnknownUfanetIntercomAPIError as err:
+                # The server answers but refuses, retrying soon will not help.
+                rejections += 1
+                if rejections >= EVENTS_MAX_REJECTIONS:
+                    _LOGGER.warning("Intercom events keep failing: %s", err)
+                    self._stop()
+                    return
+                await self._async_reconnect(EVENTS_RECONNECT_MAX, err)
+                continue
+            except Exception as err:  # noqa: BLE001
+                delay = max(
+                    backoff_delay(attempt, EVENTS_RECONNECT_MAX),
+                    getattr(err, "retry_after", 0) or 0,
+                )
+                attempt += 1
+                await self._async_reconnect(delay, err)
+                continue
+            attempt = rejections = 0
+            self._set_healthy(True)
+            for event in events:
+                self._dispatch(event)
+
+    async def _async_reconnect(self, delay: float, err: Exception) -> None:
+        """Wait before the next request after a failed one."""
+        self._set_healthy(False)
+        self.reconnects += 1
+        _LOGGER.debug("Event channel failed, reconnecting in %.1fs: %s", delay, err)
+        await asyncio.sleep(delay)
+
+    @callback
+    def _stop(self) -> None:
+        """Give up on the channel, polling carries on."""
+        self.supported = False
+        self._set_healthy(False)
+
+    @callback
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        """Send event to the entity of its intercom."""
+        self.events += 1
+        if (timestamp := event.get("time")) is not None:
+            self.last_delay = max(0.0, time.time() - timestamp)
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_INTERCOM_EVENT.format(
+                entry_id=self._entry.entry_id, intercom_id=event.get("intercom")
+            ),
+            event,
+        )
+
+    @callback
+    def _set_healthy(self, healthy: bool) -> None:
+        """Report channel health changes."""
+        if healthy != self.healthy:
+            self.healthy = healthy
+            _LOGGER.debug("Event channel %s", "healthy" if healthy else "down")
+            self._on_health(healthy)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return listener state for diagnostics."""
+        return {
+            "supported": self.supported,
+            "healthy": self.healthy,
+            "events": self.events,
+            "reconnects": self.reconnects,
+            "last_delay": self.last_delay,
+        }
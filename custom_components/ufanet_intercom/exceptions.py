@@ -1,6 +1,10 @@
 class UfanetIntercomAPIError(Exception):
     """"""
 
+    def __init__(self, *args: object, retry_after: float | None = None) -> None:
+        super().__init__(*args)
+        self.retry_after = retry_after
+
 
 class ClientConnectorUfanetIntercomAPIError(UfanetIntercomAPIError):
     """"""
@@ -14,5 +18,29 @@ class TimeoutUfanetIntercomAPIError(UfanetIntercomAPIError):
     """"""
 
 
+class ServerUfanetIntercomAPIError(UfanetIntercomAPIError):
+    """"""
+
+
+class TooManyRequestsUfanetIntercomAPIError(UfanetIntercomAPIError):
+    """"""
+
+
+class CircuitOpenUfanetIntercomAPIError(UfanetIntercomAPIError):
+    """"""
+
+
 class UnknownUfanetIntercomAPIError(UfanetIntercomAPIError):
     """"""
+
+
+class NotSupportedUfanetIntercomAPIError(UnknownUfanetIntercomAPIError):
+    """"""
+
+
+class RtspUfanetIntercomError(Exception):
+    """"""
+
+
+class RtspConnectionUfanetIntercomError(RtspUfanetIntercomError):
+    """"""
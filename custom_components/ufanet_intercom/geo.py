@@ -0,0 +1,168 @@
+"""Spatial index over camera coordinates."""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+import heapq
+import math
+
+from .const import CAMERA_GRID_CELL
+from .models import UCamera
+
+EARTH_RADIUS = 6_371_008.8
+_METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+
+def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return great-circle distance in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+class CameraIndex:
+    """Uniform grid of cameras for radius and nearest neighbour queries.
+
+    Cells are cell_size meters high and about as wide at the mean latitude
+    of the cameras, which is plenty for a city.
+    """
+
+    def __init__(
+        self, cameras: Iterable[UCamera], cell_size: float = CAMERA_GRID_CELL
+    ) -> None:
+        """Build index."""
+        cameras = list(cameras)
+        mean_lat = sum(c.latitude for c in cameras) / len(cameras) if cameras else 0
+        self._lat_step = cell_size / _METERS_PER_DEGREE
+        self._lon_step = self._lat_step / max(math.cos(math.radians(mean_lat)), 0.01)
+        self._cells: dict[tuple[int, int], list[UCamera]] = defaultdict(list)
+        for camera in cameras:
+            self._cells[self._cell(camera.latitude, camera.longitude)].append(camera)
+        self._cells = dict(self._cells)
+        self._size = len(cameras)
+        if self._cells:
+            rows = [row for row, _ in self._cells]
+            cols = [col for _, col in self._cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+
+    def __len__(self) -> int:
+        """Return number of indexed cameras."""
+        return self._size
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """Return cell of a point."""
+        return math.floor(lat / self._lat_step), math.floor(lon / self._lon_step)
+
+    def within(self, lat: float, lon: float, radius: float) -> list[UCamera]:
+        """Return cameras within radius meters of a point, nearest first."""
+        if not self._cells:
+            return []
+        row, col = self._cell(lat, lon)
+        dlat = radius / _METERS_PER_DEGREE
+        coslat = math.cos(math.radians(min(89.0, abs(lat) + dlat)))
+        rows = math.ceil(dlat / self._lat_step)
+        cols = math.ceil(dlat / max(coslat, 0.01) / self._lon_step)
+        # Cells outside the populated area are empty.
+        min_row, max_row, min_col, max_col = self._bounds
+        row_range = range(max(row - rows, min_row), min(row + rows, max_row) + 1)
+        col_range = range(max(col - cols, min_col), min(col + cols, max_col) + 1)
+        if len(row_range) * len(col_range) > len(self._cells):
+            cells = [
+                cameras
+                for (r, c), cameras in self._cells.items()
+                if r in row_range and c in col_range
+            ]
+        else:
+            cells = [self._cells.get((r, c), ()) for r in row_range for c in col_range]
+        found = []
+        for cameras in cells:
+            for camera in cameras:
+                dist = distance(lat, lon, camera.latitude, camera.longitude)
+                if dist <= radius:
+                    found.append((dist, camera))
+        found.sort(key=lambda item: item[0])
+        return [camera for _, camera in found]
+
+    def nearest(
+        self, lat: float, lon: float, count: int, max_distance: float | None = None
+    ) -> list[tuple[float, UCamera]]:
+        """Return up to count nearest cameras with their distance in meters."""
+        if not self._cells or count <= 0:
+            return []
+        row, col = self._cell(lat, lon)
+        # Any camera outside ring r is at least this far per ring.
+        ring_width = (
+            min(self._lat_step, self._lon_step * math.cos(math.radians(lat)))
+            * _METERS_PER_DEGREE
+        )
+        best: list[tuple[float, int, UCamera]] = []
+        seen = 0
+        walked = 0
+        for ring, cells in self._rings(row, col):
+            bound = (ring - 1) * ring_width if ring else 0.0
+            if len(best) == count and -best[0][0] <= bound:
+                break
+            if max_distance is not None and bound > max_distance:
+                break
+            # Far from the cameras or on a sparse grid a scan is cheaper.
+            walked += len(cells)
+            if walked > len(self._cells):
+                return self._scan(lat, lon, count, max_distance)
+            for cell in cells:
+                for camera in self._cells.get(cell, ()):
+                    seen += 1
+                    dist = distance(lat, lon, camera.latitude, camera.longitude)
+                    if max_distance is not None and dist > max_distance:
+                        continue
+                    item = (-dist, id(camera), camera)
+                    if len(best) < count:
+                        heapq.heappush(best, item)
+                    elif dist < -best[0][0]:
+                        heapq.heapreplace(best, item)
+            if seen == self._size:
+                break
+        # Cameras on one building are equally far, they must not be compared.
+        return sorted(
+            ((-neg, camera) for neg, _, camera in best), key=lambda item: item[0]
+        )
+
+    def _scan(
+        self, lat: float, lon: float, count: int, max_distance: float | None
+    ) -> list[tuple[float, UCamera]]:
+        """Return up to count nearest cameras, checking every camera."""
+        found = (
+            (distance(lat, lon, camera.latitude, camera.longitude), camera)
+            for cameras in self._cells.values()
+            for camera in cameras
+        )
+        if max_distance is not None:
+            found = ((dist, camera) for dist, camera in found if dist <= max_distance)
+        return heapq.nsmallest(count, found, key=lambda item: item[0])
+
+    def _rings(self, row: int, col: int) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+        """Yield populated area cells in square rings around a cell.
+
+        Rings start at the first one that reaches the populated area and stop
+        once it is covered.
+        """
+        min_row, max_row, min_col, max_col = self._bounds
+        first = max(min_row - row, row - max_row, min_col - col, col - max_col, 0)
+        reach = max(
+            abs(row - min_row),
+            abs(row - max_row),
+            abs(col - min_col),
+            abs(col - max_col),
+        )
+        if first == 0:
+            yield 0, [(row, col)]
+        for ring in range(max(first, 1), reach + 1):
+            cols = range(max(col - ring, min_col), min(col + ring, max_col) + 1)
+            rows = range(max(row - ring + 1, min_row), min(row + ring - 1, max_row) + 1)
+            cells = [(r, c) for r in (row - ring, row + ring) for c in cols]
+            cells = [cell for cell in cells if min_row <= cell[0] <= max_row]
+            for c in (col - ring, col + ring):
+                if min_col <= c <= max_col:
+                    cells += [(r, c) for r in rows]
+            yield ring, cells
@@ -0,0 +1,238 @@
+"""Local buffer of Ufanet intercom call and door history."""
+
+import asyncio
+from bisect import insort
+from collections import deque
+from collections.abc import Collection, Iterable
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .api import UfanetAPI
+from .const import (
+    HISTORY_INITIAL_WINDOW,
+    HISTORY_MAX_PAGES,
+    HISTORY_MAX_RECORDS,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STORAGE_KEY,
+    HISTORY_SYNC_INTERVAL,
+    STORAGE_VERSION,
+)
+from .exceptions import NotSupportedUfanetIntercomAPIError
+from .models import HistoryRecord
+from .safe_logger import RedactingFilter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+
+def _order(record: HistoryRecord) -> tuple[float, int]:
+    """Return sort key of a record."""
+    return record.time, record.id
+
+
+class HistoryStore:
+    """Call and door history, synced page by page from a cursor.
+
+    Keeps the newest max_records records in time order, overall and per
+    intercom, so recent questions are answered without a request. Storage
+    holds a copy of the whole buffer, written at most every
+    HISTORY_SAVE_DELAY seconds and on stop.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: UfanetAPI,
+        max_records: int = HISTORY_MAX_RECORDS,
+    ) -> None:
+        """Initialize history store."""
+        self.hass = hass
+        self._entry = entry
+        self._api = api
+        self.max_records = max_records
+        self._records: deque[HistoryRecord] = deque()
+        self._by_intercom: dict[int, deque[HistoryRecord]] = {}
+        self._ids: set[int] = set()
+        self.cursor: str | None = None
+        self.supported = True
+        self.last_sync: float | None = None
+        self.requests = 0
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, HISTORY_STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        self._loaded = False
+        self._sync_task: asyncio.Task[int] | None = None
+        self._unsub_sync: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return number of buffered records."""
+        return len(self._records)
+
+    @callback
+    def async_start(self) -> None:
+        """Load the buffer and sync it periodically in the background."""
+        if self._unsub_sync is not None:
+            return
+        self._unsub_sync = async_track_time_interval(
+            self.hass,
+            self._async_scheduled_sync,
+            timedelta(seconds=HISTORY_SYNC_INTERVAL),
+            name="ufanet_intercom history",
+        )
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_scheduled_sync(None),
+            f"ufanet_intercom history {self._entry.entry_id}",
+        )
+
+    async def async_stop(self) -> None:
+        """Stop syncing and write the buffer."""
+        if self._unsub_sync is not None:
+            self._unsub_sync()
+            self._unsub_sync = None
+        if (task := self._sync_task) is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._loaded:
+            await self._store.async_save(self._data())
+
+    async def async_load(self) -> None:
+        """Restore buffer and cursor from storage."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not (stored := await self._store.async_load()):
+            return
+        try:
+            records = [
+                HistoryRecord(id=i, intercom=intercom, type=kind, time=at, who=who)
+                for i, intercom, kind, at, who in stored["records"]
+            ]
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Ignoring invalid history: %s", err)
+            return
+        self.cursor = stored.get("cursor")
+        self._add(records)
+        _LOGGER.debug("Restored %d history records", len(self._records))
+
+    @callback
+    def _data(self) -> dict[str, Any]:
+        """Return buffer to store, records as rows to keep the file small."""
+        return {
+            "cursor": self.cursor,
+            "records": [
+                [r.id, r.intercom, r.type, r.time, r.who] for r in self._records
+            ],
+        }
+
+    async def _async_scheduled_sync(self, _now: datetime | None) -> None:
+        """Sync, failures wait for the next interval."""
+        try:
+            await self.async_sync()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("History sync failed: %s", err)
+
+    async def async_sync(self) -> int:
+        """Fetch records newer than the cursor, return how many were added."""
+        if not self.supported:
+            return 0
+        if (task := self._sync_task) is None:
+            task = self._sync_task = asyncio.create_task(self._async_sync())
+            task.add_done_callback(lambda _: setattr(self, "_sync_task", None))
+        return await asyncio.shield(task)
+
+    async def _async_sync(self) -> int:
+        """Page through new records."""
+        await self.async_load()
+        added = 0
+        try:
+            for _ in range(HISTORY_MAX_PAGES):
+                since = None
+                if self.cursor is None:
+                    since = time.time() - HISTORY_INITIAL_WINDOW
+                self.requests += 1
+                cursor, records, more = await self._api.async_get_history(
+                    self.cursor, since
+                )
+                added += self._add(records)
+                self.cursor = cursor
+                if not more:
+                    break
+        except NotSupportedUfanetIntercomAPIError as err:
+            _LOGGER.info("Intercom history is not available: %s", err)
+            self.supported = False
+            return added
+        finally:
+            if added:
+                self._store.async_delay_save(self._data, HISTORY_SAVE_DELAY)
+        self.last_sync = time.time()
+        if added:
+            _LOGGER.debug("Added %d history records", added)
+        return added
+
+    def _add(self, records: Iterable[HistoryRecord]) -> int:
+        """Insert records in time order and evict the oldest ones."""
+        added = 0
+        for record in sorted(records, key=_order):
+            if record.id in self._ids:
+                continue
+            self._ids.add(record.id)
+            added += 1
+            per_intercom = self._by_intercom.setdefault(record.intercom, deque())
+            for buffer in (self._records, per_intercom):
+                if buffer and _order(buffer[-1]) > _order(record):
+                    insort(buffer, record, key=_order)
+                else:
+                    buffer.append(record)
+
+        while len(self._records) > self.max_records:
+            oldest = self._records.popleft()
+            self._ids.discard(oldest.id)
+            per_intercom = self._by_intercom[oldest.intercom]
+            per_intercom.popleft()
+            if not per_intercom:
+                del self._by_intercom[oldest.intercom]
+        return added
+
+    def query(
+        self,
+        intercom_id: int | None = None,
+        since: float | None = None,
+        types: Collection[str] | None = None,
+        limit: int | None = None,
+    ) -> list[HistoryRecord]:
+        """Return buffered records, newest first."""
+        if intercom_id is None:
+            source: Iterable[HistoryRecord] = self._records
+        else:
+            source = self._by_intercom.get(intercom_id, ())
+        found = []
+        for record in reversed(source):
+            if since is not None and record.time < since:
+                break
+            if types and record.type not in types:
+                continue
+            found.append(record)
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return store state for diagnostics."""
+        return {
+            "supported": self.supported,
+            "records": len(self._records),
+            "intercoms": len(self._by_intercom),
+            "oldest": self._records[0].time if self._records else None,
+            "newest": self._records[-1].time if self._records else None,
+            "last_sync": self.last_sync,
+            "requests": self.requests,
+        }
@@ -0,0 +1,155 @@
+"""Shared resources for all Ufanet config entries."""
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+from typing import Any
+from weakref import WeakValueDictionary
+
+from aiohttp import ClientSession
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DATA_HUB,
+    HUB_POLL_BUDGET,
+    HUB_RATE_BURST,
+    HUB_RATE_LIMIT,
+    UPDATE_INTERVAL,
+)
+from .models import UCamera
+from .transport import ConnectionStats, async_warm_up, create_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Golden ratio spacing spreads any number of entries evenly over the interval.
+_PHASE_STEP = 0.6180339887
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable copy of a JSON value."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class TokenBucket:
+    """Token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize bucket with rate tokens per second."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class UfanetHub:
+    """Connection pool, rate limit and shared data for all contracts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize hub."""
+        self.hass = hass
+        self.connections = ConnectionStats()
+        self._session: ClientSession | None = None
+        self._warm_ups: dict[str, asyncio.Task[None]] = {}
+        self.limiter = TokenBucket(HUB_RATE_LIMIT, HUB_RATE_BURST)
+        self._cameras: WeakValueDictionary[tuple, UCamera] = WeakValueDictionary()
+        self._registered = 0
+        self._slots = 0
+        self._poll_rates: dict[str, float] = {}
+        # Entries are not unloaded on shutdown, so the pool is closed here.
+        self._unsub_close: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close
+        )
+
+    @callback
+    def async_register(self) -> float:
+        """Register an entry and return its poll phase offset in seconds."""
+        self._registered += 1
+        phase = (self._slots * _PHASE_STEP) % 1 * UPDATE_INTERVAL
+        self._slots += 1
+        return phase
+
+    async def async_unregister(self) -> None:
+        """Unregister an entry, closing the pool after the last one."""
+        self._registered -= 1
+        if not self._registered:
+            if self._unsub_close is not None:
+                self._unsub_close()
+            await self._async_close(None)
+
+    async def _async_close(self, _event: Event | None) -> None:
+        """Close the pool, the next entry creates a new hub."""
+        self._unsub_close = None
+        self.hass.data.pop(DATA_HUB, None)
+        if self._session is not None:
+            await self._session.close()
+
+    @callback
+    def async_get_session(self, dedicated: bool) -> ClientSession:
+        """Return the dedicated Ufanet pool or Home Assistant's shared session."""
+        if not dedicated:
+            return async_get_clientsession(self.hass)
+        if self._session is None:
+            self._session = create_session(self.connections)
+        return self._session
+
+    async def async_warm_up(self, url: str) -> None:
+        """Open dedicated pool connections to a host, sharing a running warm-up."""
+        if (task := self._warm_ups.get(url)) is None:
+            task = self._warm_ups[url] = asyncio.create_task(
+                async_warm_up(self.async_get_session(True), url)
+            )
+            task.add_done_callback(lambda _: self._warm_ups.pop(url, None))
+        await asyncio.shield(task)
+
+    @callback
+    def async_set_poll_rate(self, key: str, rate: float) -> None:
+        """Record planned polls per second of an entry."""
+        if rate:
+            self._poll_rates[key] = rate
+        else:
+            self._poll_rates.pop(key, None)
+
+    @property
+    def poll_scale(self) -> float:
+        """Return factor stretching poll intervals to fit the budget."""
+        return max(1.0, sum(self._poll_rates.values()) * 3600 / HUB_POLL_BUDGET)
+
+    def intern_camera(
+        self, data: dict[str, Any], parse: Callable[[dict[str, Any]], UCamera]
+    ) -> UCamera:
+        """Return camera model, reusing it if another contract has the same one."""
+        key = _freeze(data)
+        if (camera := self._cameras.get(key)) is None:
+            camera = self._cameras[key] = parse(data)
+        return camera
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> UfanetHub:
+    """Return the shared hub, creating it on first use."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = UfanetHub(hass)
+    return hub
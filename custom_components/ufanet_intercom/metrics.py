@@ -0,0 +1,103 @@
+"""Cheap always-on metrics for Ufanet API calls."""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from .const import LATENCY_BUCKETS
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Latency histogram, sizes and errors of one endpoint."""
+
+    requests: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    last_latency: float | None = None
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    bytes_total: int = 0
+    last_size: int | None = None
+    errors: dict[str, int] = field(default_factory=dict)
+    last_success: float | None = None
+    last_error: float | None = None
+
+    def _observe(self, latency: float) -> None:
+        """Count request latency."""
+        self.requests += 1
+        self.latency_total += latency
+        self.last_latency = latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def observe_success(self, latency: float, size: int) -> None:
+        """Count successful request."""
+        self._observe(latency)
+        self.bytes_total += size
+        self.last_size = size
+        self.last_success = time.time()
+
+    def observe_error(self, latency: float, err: BaseException) -> None:
+        """Count failed request."""
+        self._observe(latency)
+        name = type(err).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+        self.last_error = time.time()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "latency_avg": (
+                self.latency_total / self.requests if self.requests else None
+            ),
+            "latency_max": self.latency_max,
+            "last_latency": self.last_latency,
+            "latency_histogram": {
+                **{f"le_{b}": n for b, n in zip(LATENCY_BUCKETS, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+            "bytes_total": self.bytes_total,
+            "last_size": self.last_size,
+            "errors": dict(self.errors),
+            "last_success": self.last_success,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass(slots=True)
+class ApiMetrics:
+    """Metrics of one API client."""
+
+    endpoints: dict[str, EndpointMetrics] = field(default_factory=dict)
+    logins: int = 0
+    token_refreshes: int = 0
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return metrics of an endpoint."""
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    @property
+    def errors(self) -> int:
+        """Return total errors."""
+        return sum(sum(m.errors.values()) for m in self.endpoints.values())
+
+    @property
+    def last_success(self) -> float | None:
+        """Return time of the last successful request."""
+        return max(
+            (m.last_success for m in self.endpoints.values() if m.last_success),
+            default=None,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return metrics for diagnostics."""
+        return {
+            "logins": self.logins,
+            "token_refreshes": self.token_refreshes,
+            "endpoints": {k: m.as_dict() for k, m in self.endpoints.items()},
+        }
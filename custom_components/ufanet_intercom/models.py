@@ -1,6 +1,14 @@
 """Models for Ufanet api."""
 
-from pydantic import BaseModel, computed_field
+import sys
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr, computed_field
+
+
+def _rtsp_url(domain: str, number: str, token: str) -> str:
+    """Return camera rtsp url."""
+    return f"rtsp://{domain}/{number}?token={token}"
 
 
 class Token(BaseModel):
@@ -23,7 +31,17 @@ class Contract(BaseModel):
 
     id: int
     title: str
-    balance: int
+    balance: float
+
+
+class HistoryRecord(BaseModel):
+    """Call or door opening in intercom history."""
+
+    id: int
+    intercom: int
+    type: str
+    time: float
+    who: str | None = None
 
 
 class Intercom(BaseModel):
@@ -52,6 +70,15 @@ class Intercom(BaseModel):
     ble_support: bool
     scope: str
 
+    def compact(self, shared: dict[tuple, Any]) -> None:
+        """Share an equal role with other intercoms."""
+        key = (Role, *self.role.__dict__.values())
+        if (role := shared.get(key)) is None:
+            role = shared[key] = self.role
+            role.__dict__["name"] = sys.intern(role.name)
+        # Written past __setattr__, the values are already validated.
+        self.__dict__["role"] = role
+
 
 class Servers(BaseModel):
     """Server model."""
@@ -75,8 +102,27 @@ class UCamera(BaseModel):
     servers: Servers
     type: str
 
+    _rtsp_url: str = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build rtsp url once."""
+        self._rtsp_url = _rtsp_url(self.servers.domain, self.number, self.token_l)
+
     @computed_field
     @property
     def rtsp_url(self) -> str:
         """Get rtsp url from model."""
-        return f"rtsp://{self.servers.domain}/{self.number}?token={self.token_l}"
+        return self._rtsp_url
+
+    def compact(self, shared: dict[tuple, Any]) -> None:
+        """Intern repeated strings and share equal servers with other cameras."""
+        key = (Servers, *self.servers.__dict__.values())
+        if (servers := shared.get(key)) is None:
+            servers = shared[key] = self.servers
+            for field in ("domain", "screenshot_domain", "vendor_name"):
+                servers.__dict__[field] = sys.intern(servers.__dict__[field])
+        # Written past __setattr__, the values are already validated.
+        values = self.__dict__
+        values["servers"] = servers
+        values["address"] = sys.intern(values["address"])
+        values["type"] = sys.intern(values["type"])
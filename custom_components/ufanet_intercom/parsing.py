@@ -0,0 +1,52 @@
+"""Payload parsing that keeps models of unchanged items."""
+
+from collections.abc import Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class ModelParser(Generic[_ModelT]):
+    """Validate new and changed payload items, reuse models of unchanged ones.
+
+    An item equal to the one seen last time under its key returns the
+    previous model without validation, so equality checks downstream stop
+    at identity. New models share equal nested models with older ones when
+    the model has a compact method.
+    """
+
+    def __init__(self, model: type[_ModelT], key: str) -> None:
+        """Initialize parser."""
+        self._model = model
+        self._key = key
+        self._compact = getattr(model, "compact", None)
+        self._items: dict[Hashable, tuple[dict[str, Any], _ModelT]] = {}
+        self._shared: dict[tuple, Any] = {}
+
+    def parse(self, data: dict[str, Any]) -> _ModelT:
+        """Return model for a payload item."""
+        key = data.get(self._key)
+        if (item := self._items.get(key)) is not None and item[0] == data:
+            return item[1]
+        model = self._model.model_validate(data)
+        if item is not None and item[1] == model:
+            # Same values written differently, keep the old instance.
+            model = item[1]
+        elif self._compact is not None:
+            self._compact(model, self._shared)
+        self._items[key] = (data, model)
+        return model
+
+    def parse_list(self, data: list[dict[str, Any]]) -> list[_ModelT]:
+        """Return models for payload items, forgetting items that are gone."""
+        models = [self.parse(item) for item in data]
+        self.prune(data)
+        return models
+
+    def prune(self, data: Iterable[dict[str, Any]]) -> None:
+        """Forget items whose key is missing from data."""
+        keys = {item.get(self._key) for item in data}
+        if not keys.issuperset(self._items):
+            self._items = {k: v for k, v in self._items.items() if k in keys}
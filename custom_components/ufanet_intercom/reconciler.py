@@ -0,0 +1,74 @@
+"""Keep platform entities in sync with coordinator data."""
+
+from collections.abc import Callable, Hashable
+import logging
+from typing import Any, Generic, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import UfanetDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+_ModelT = TypeVar("_ModelT")
+_EntityT = TypeVar("_EntityT", bound=Entity)
+
+
+class EntityReconciler(Generic[_ModelT, _EntityT]):
+    """Add and remove entities by record key when coordinator data changes.
+
+    Changed records reach their entities through the coordinator directly.
+    """
+
+    def __init__(
+        self,
+        coordinator: UfanetDataCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        data_key: str,
+        factory: Callable[[_ModelT], _EntityT],
+        include: Callable[[_ModelT], bool] = lambda _: True,
+    ) -> None:
+        """Initialize reconciler."""
+        self.coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._data_key = data_key
+        self._factory = factory
+        self._include = include
+        self._records: dict[Hashable, Any] | None = None
+        self._entities: dict[Hashable, _EntityT] = {}
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Create initial entities and follow coordinator updates."""
+        self._async_reconcile()
+        return self.coordinator.async_add_listener(self._async_reconcile)
+
+    @callback
+    def _async_reconcile(self) -> None:
+        """Apply difference between entities and current records."""
+        records: dict[Hashable, _ModelT] = self.coordinator.records[self._data_key]
+        # Unchanged lists keep their index, nothing to do.
+        if records is self._records:
+            return
+        self._records = records
+
+        keys = {key for key, model in records.items() if self._include(model)}
+        added: list[_EntityT] = []
+        for key, model in records.items():
+            if key in keys and key not in self._entities:
+                entity = self._entities[key] = self._factory(model)
+                added.append(entity)
+        removed = self._entities.keys() - keys
+
+        if added:
+            _LOGGER.debug("Adding %d %s entities", len(added), self._data_key)
+            self._async_add_entities(added)
+        if removed:
+            _LOGGER.debug("Removing %d %s entities", len(removed), self._data_key)
+            for key in removed:
+                # Registry entries stay, the user's settings survive a record
+                # that is briefly missing, and the user removes stale ones.
+                entity = self._entities.pop(key)
+                self.coordinator.hass.async_create_task(entity.async_remove())
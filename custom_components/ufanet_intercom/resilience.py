@@ -0,0 +1,104 @@
+"""Backoff and circuit breaker for Ufanet API."""
+
+from email.utils import parsedate_to_datetime
+import random
+import time
+
+from .const import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RESET_TIMEOUT,
+    BREAKER_RESET_TIMEOUT,
+)
+from .exceptions import CircuitOpenUfanetIntercomAPIError
+
+
+def backoff_delay(attempt: int, cap: float = BACKOFF_MAX) -> float:
+    """Return exponential backoff delay with full jitter."""
+    return random.uniform(0, min(cap, BACKOFF_BASE * 2**attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse Retry-After header given in seconds or as HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Fail fast on an endpoint that keeps failing, probing it occasionally."""
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        max_reset_timeout: float = BREAKER_MAX_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize circuit breaker."""
+        self.name = name
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._failures = 0
+        self._trips = 0
+        self._open_until: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are rejected."""
+        return self._open_until is not None
+
+    def before_request(self) -> bool:
+        """Raise if request must not be sent now, return True for a probe."""
+        if self._open_until is None:
+            return False
+        if self._probing or time.monotonic() < self._open_until:
+            raise CircuitOpenUfanetIntercomAPIError(
+                f"Circuit open for {self.name}",
+                retry_after=self.remaining(),
+            )
+        # Half-open, let a single probe through.
+        self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Let the next request probe again, the last one ended without a verdict."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close circuit."""
+        self._failures = 0
+        self._trips = 0
+        self._open_until = None
+        self._probing = False
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count failure and open circuit when threshold is reached."""
+        self._failures += 1
+        if self._probing or self._failures >= self._threshold:
+            timeout = min(self._max_reset_timeout, self._reset_timeout * 2**self._trips)
+            self._trips += 1
+        elif retry_after:
+            timeout = 0.0
+        else:
+            return
+        if retry_after:
+            timeout = max(timeout, retry_after)
+        self._open_until = time.monotonic() + timeout
+        self._probing = False
+
+    def remaining(self) -> float:
+        """Return seconds until the next request may be sent."""
+        if self._open_until is None:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
@@ -0,0 +1,269 @@
+"""RTSP health probes of Ufanet camera streams."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import random
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    RTSP_DEFAULT_PORT,
+    RTSP_PROBE_CONCURRENCY,
+    RTSP_PROBE_INTERVAL,
+    RTSP_PROBE_MAX_INTERVAL,
+    RTSP_PROBE_PER_SERVER,
+    RTSP_PROBE_TICK,
+    RTSP_PROBE_TIMEOUT,
+)
+from .exceptions import RtspConnectionUfanetIntercomError, RtspUfanetIntercomError
+from .models import UCamera
+from .safe_logger import RedactingFilter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+
+async def async_probe(url: str, timeout: float = RTSP_PROBE_TIMEOUT) -> float:
+    """Send RTSP OPTIONS to url and return the round trip in seconds.
+
+    Only the status line is read, no media is set up.
+    """
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or RTSP_DEFAULT_PORT
+    start = time.monotonic()
+    try:
+        async with asyncio.timeout(timeout):
+            reader, writer = await asyncio.open_connection(host, port)
+    except (OSError, TimeoutError) as err:
+        raise RtspConnectionUfanetIntercomError(
+            f"Cannot connect to {host}:{port}: {err!r}"
+        ) from err
+    try:
+        async with asyncio.timeout(max(0.0, timeout - (time.monotonic() - start))):
+            writer.write(
+                f"OPTIONS {url} RTSP/1.0\r\n"
+                "CSeq: 1\r\n"
+                "User-Agent: Home Assistant\r\n\r\n".encode()
+            )
+            status = await reader.readline()
+    except (OSError, TimeoutError) as err:
+        raise RtspUfanetIntercomError(f"No RTSP response: {err!r}") from err
+    finally:
+        writer.close()
+        with suppress(OSError):
+            await writer.wait_closed()
+    latency = time.monotonic() - start
+
+    version, _, rest = status.decode("latin-1").partition(" ")
+    code = rest.split(" ", 1)[0]
+    if not version.startswith("RTSP/") or not code.isdigit():
+        raise RtspUfanetIntercomError(f"Not an RTSP response: {status[:40]!r}")
+    if int(code) >= 400:
+        raise RtspUfanetIntercomError(f"RTSP {rest.strip()}")
+    return latency
+
+
+@dataclass(slots=True)
+class ProbeState:
+    """Probe result of a camera or a server."""
+
+    available: bool | None = None
+    latency: float | None = None
+    failures: int = 0
+    next_probe: float = 0.0
+    last_error: str | None = None
+
+    def succeeded(self, latency: float | None, now: float) -> None:
+        """Record a successful probe."""
+        self.available = True
+        self.latency = latency
+        self.failures = 0
+        self.last_error = None
+        # Jitter spreads probes of cameras that were found together.
+        self.next_probe = now + RTSP_PROBE_INTERVAL * random.uniform(0.9, 1.1)
+
+    def failed(self, err: Exception, now: float) -> None:
+        """Record a failed probe, checking again sooner at first."""
+        self.available = False
+        self.failures += 1
+        self.last_error = str(err)
+        delay = RTSP_PROBE_TICK * 2 ** (self.failures - 1)
+        self.next_probe = now + min(RTSP_PROBE_MAX_INTERVAL, delay)
+
+    def unreachable(self, err: Exception) -> None:
+        """Record that the server is down, the server backs off instead."""
+        self.available = False
+        self.last_error = str(err)
+        self.next_probe = 0.0
+
+
+class CameraProber:
+    """Probe camera streams in the background and track their availability.
+
+    Probes run with bounded concurrency overall and per server. A server that
+    refuses connections fails its whole batch with one attempt and backs off.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        on_change: Callable[[set[str]], None],
+        probe: Callable[[str], Awaitable[float]] = async_probe,
+    ) -> None:
+        """Initialize prober."""
+        self.hass = hass
+        self._entry = entry
+        self._on_change = on_change
+        self._probe = probe
+        self.states: dict[str, ProbeState] = {}
+        self.servers: dict[str, ProbeState] = {}
+        self.probes = 0
+        self._semaphore = asyncio.Semaphore(RTSP_PROBE_CONCURRENCY)
+        self._cameras: Callable[[], Iterable[UCamera]] = list
+        self._task: asyncio.Task[None] | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    def available(self, number: str) -> bool:
+        """Return False if the last probe of the camera failed."""
+        state = self.states.get(number)
+        return state is None or state.available is not False
+
+    def latency(self, number: str) -> float | None:
+        """Return last probe latency of the camera."""
+        state = self.states.get(number)
+        return state.latency if state is not None else None
+
+    @callback
+    def async_start(self, cameras: Callable[[], Iterable[UCamera]]) -> None:
+        """Probe due cameras every tick."""
+        if self._unsub is not None:
+            return
+        self._cameras = cameras
+        self._unsub = async_track_time_interval(
+            self.hass,
+            self._async_tick,
+            timedelta(seconds=RTSP_PROBE_TICK),
+            name="ufanet_intercom rtsp probe",
+        )
+        self._async_tick(None)
+
+    async def async_stop(self) -> None:
+        """Stop probing."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if (task := self._task) is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @callback
+    def _async_tick(self, _now: datetime | None) -> None:
+        """Start a probe round unless the last one is still running."""
+        if self._task is None:
+            self._task = self._entry.async_create_background_task(
+                self.hass,
+                self.async_probe_due(self._cameras()),
+                f"ufanet_intercom rtsp probe {self._entry.entry_id}",
+            )
+            self._task.add_done_callback(lambda _: setattr(self, "_task", None))
+
+    async def async_probe_due(self, cameras: Iterable[UCamera]) -> None:
+        """Probe cameras whose next probe is due, batched by server."""
+        now = time.monotonic()
+        batches: dict[str, list[UCamera]] = {}
+        states = {}
+        for camera in cameras:
+            state = states[camera.number] = (
+                self.states.get(camera.number) or ProbeState()
+            )
+            if state.next_probe > now:
+                continue
+            server = self.servers.get(camera.servers.domain)
+            if server is not None and server.failures and server.next_probe > now:
+                continue
+            batches.setdefault(camera.servers.domain, []).append(camera)
+        # Forget removed cameras.
+        self.states = states
+        if not batches:
+            return
+
+        changed: set[str] = set()
+        await asyncio.gather(
+            *(
+                self._async_probe_server(domain, batch, changed)
+                for domain, batch in batches.items()
+            )
+        )
+        if changed:
+            self._on_change(changed)
+
+    async def _async_probe_server(
+        self, domain: str, cameras: list[UCamera], changed: set[str]
+    ) -> None:
+        """Probe cameras of one server, giving up on it if it is unreachable."""
+        server = self.servers.setdefault(domain, ProbeState())
+        server_semaphore = asyncio.Semaphore(RTSP_PROBE_PER_SERVER)
+        down: RtspConnectionUfanetIntercomError | None = None
+
+        async def _async_probe_camera(camera: UCamera) -> None:
+            nonlocal down
+            state = self.states[camera.number]
+            was_available = state.available is not False
+            async with server_semaphore, self._semaphore:
+                if down is None:
+                    self.probes += 1
+                    try:
+                        latency = await self._probe(camera.rtsp_url)
+                    except RtspConnectionUfanetIntercomError as err:
+                        down = err
+                        state.unreachable(err)
+                    except RtspUfanetIntercomError as err:
+                        state.failed(err, time.monotonic())
+                    else:
+                        state.succeeded(latency, time.monotonic())
+                else:
+                    state.unreachable(down)
+            if state.available != was_available:
+                changed.add(camera.number)
+
+        await asyncio.gather(*(_async_probe_camera(camera) for camera in cameras))
+        now = time.monotonic()
+        if down is not None:
+            server.failed(down, now)
+            _LOGGER.debug(
+                "RTSP server %s unreachable, retry in %.0fs: %s",
+                domain,
+                server.next_probe - now,
+                down,
+            )
+        else:
+            server.succeeded(None, now)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return probe summary for diagnostics."""
+        latencies = sorted(
+            state.latency
+            for state in self.states.values()
+            if state.available and state.latency is not None
+        )
+        return {
+            "probes": self.probes,
+            "cameras": len(self.states),
+            "unavailable": sum(
+                state.available is False for state in self.states.values()
+            ),
+            "servers_down": sorted(
+                domain for domain, server in self.servers.items() if server.failures
+            ),
+            "latency_p50": latencies[len(latencies) // 2] if latencies else None,
+        }
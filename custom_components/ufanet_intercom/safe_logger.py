@@ -1,12 +1,150 @@
 import logging
+from collections.abc import Collection, Mapping
+import re
 from typing import Any
 
+from pydantic import BaseModel
+
+from .const import LOG_REDACT_MAX_DEPTH, LOG_REDACT_MAX_ITEMS, LOG_REDACT_MAX_LENGTH
+
+MASK = "***"
+
+# JWTs, camera tokens in urls and authorization headers.
+SENSITIVE_PATTERNS = (
+    (re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*"), MASK),
+    (re.compile(r"(token=)[^&\s'\"]+"), rf"\g<1>{MASK}"),
+    (re.compile(r"(JWT |Bearer )[^\s'\"]+"), rf"\g<1>{MASK}"),
+)
+
+# Plain values are passed through untouched so numeric formats keep working.
+_PLAIN_TYPES = (int, float, bool, type(None))
+
+
+class _Redacted:
+    """Log argument rendered with secrets masked when the record is formatted."""
+
+    __slots__ = ("_obj", "_filter")
+
+    def __init__(self, obj: Any, redacting_filter: "RedactingFilter") -> None:
+        """Wrap argument."""
+        self._obj = obj
+        self._filter = redacting_filter
+
+    def __str__(self) -> str:
+        """Return redacted str."""
+        return self._filter.render(self._obj, str)
+
+    def __repr__(self) -> str:
+        """Return redacted repr."""
+        return self._filter.render(self._obj, repr)
+
+
+class RedactingFilter(logging.Filter):
+    """Mask secrets in log arguments.
+
+    Logger filters only run for records that pass the level check, and the
+    arguments are only rendered when a handler formats the record.
+    """
+
+    def __init__(
+        self,
+        keys: Collection[str] | None = None,
+        max_depth: int = LOG_REDACT_MAX_DEPTH,
+        max_items: int = LOG_REDACT_MAX_ITEMS,
+        max_length: int = LOG_REDACT_MAX_LENGTH,
+    ) -> None:
+        """Initialize filter."""
+        super().__init__()
+        self.keys = frozenset(
+            k.lower()
+            for k in (
+                keys
+                if keys is not None
+                else SafeLogger.SENSITIVE_KEYS | {"token", "token_l", "token_r"}
+            )
+        )
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_length = max_length
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Wrap record arguments for lazy redaction."""
+        args = record.args
+        if isinstance(args, Mapping):
+            record.args = {
+                k: MASK if self._is_sensitive(k) else self._wrap(v)
+                for k, v in args.items()
+            }
+        elif args:
+            record.args = tuple(self._wrap(arg) for arg in args)
+        if not isinstance(record.msg, str):
+            record.msg = self._wrap(record.msg)
+        return True
+
+    def _wrap(self, arg: Any) -> Any:
+        """Return argument wrapped for lazy redaction."""
+        if isinstance(arg, (_PLAIN_TYPES, _Redacted)):
+            return arg
+        return _Redacted(arg, self)
+
+    def _is_sensitive(self, key: Any) -> bool:
+        """Return True if values of key must be masked."""
+        return isinstance(key, str) and key.lower() in self.keys
+
+    def render(self, obj: Any, to_text: Any = str) -> str:
+        """Return obj as text with secrets masked."""
+        text = self.redact_text(to_text(self.mask(obj)))
+        if len(text) > self.max_length:
+            text = f"{text[: self.max_length]}... ({len(text)} chars)"
+        return text
+
+    def mask(self, obj: Any, depth: int = 0) -> Any:
+        """Return copy of obj with sensitive keys masked, within limits."""
+        if isinstance(obj, BaseModel):
+            obj = dict(obj)
+        if isinstance(obj, Mapping):
+            if depth >= self.max_depth:
+                return f"{{... {len(obj)} keys}}"
+            masked = {
+                k: MASK if self._is_sensitive(k) else self.mask(v, depth + 1)
+                for k, v in _head(obj.items(), self.max_items)
+            }
+            if len(obj) > self.max_items:
+                masked["..."] = f"{len(obj) - self.max_items} more"
+            return masked
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            if depth >= self.max_depth:
+                return f"[... {len(obj)} items]"
+            masked = [self.mask(v, depth + 1) for v in _head(obj, self.max_items)]
+            if len(obj) > self.max_items:
+                masked.append(f"... {len(obj) - self.max_items} more")
+            return masked
+        return obj
+
+    @staticmethod
+    def redact_text(text: str) -> str:
+        """Mask secrets matched by value patterns."""
+        for pattern, replacement in SENSITIVE_PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
+
+
+def _head(items: Any, count: int) -> list:
+    """Return first count items of an iterable."""
+    head = []
+    for item in items:
+        if len(head) == count:
+            break
+        head.append(item)
+    return head
+
 
 class SafeLogger(logging.Logger):
     SENSITIVE_KEYS = {"password", "access", "refresh", "authorization"}
 
     def __init__(self, name: str):
         super().__init__(name)
+        self.addFilter(RedactingFilter(self.SENSITIVE_KEYS))
         if not self.handlers:
             handler = logging.StreamHandler()
             formatter = logging.Formatter(
@@ -16,24 +154,9 @@ class SafeLogger(logging.Logger):
             self.addHandler(handler)
             self.propagate = False
 
-    def mask_sensitive(self, obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {
-                k: (
-                    "***"
-                    if k.lower() in self.SENSITIVE_KEYS and v is not None
-                    else self.mask_sensitive(v)
-                )
-                for k, v in obj.items()
-            }
-        if isinstance(obj, list):
-            return [self.mask_sensitive(v) for v in obj]
-        return obj
-
     def safe(self, level: int, msg: str, *args: Any, **kwargs: Any):
-        safe_args = tuple(self.mask_sensitive(arg) for arg in args)
-        safe_kwargs = {k: self.mask_sensitive(v) for k, v in kwargs.items()}
-        super().log(level, msg, *safe_args, **safe_kwargs)
+        # Arguments are redacted by the filter, only if the record is emitted.
+        super().log(level, msg, *args, **kwargs)
 
     def info(self, msg: str, *args: Any, **kwargs: Any):
         self.safe(logging.INFO, msg, *args, **kwargs)
@@ -0,0 +1,89 @@
+"""Still image cache for Ufanet cameras."""
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+
+from aiohttp import ClientSession
+
+from .const import (
+    SCREENSHOT_CACHE_MAX_BYTES,
+    SCREENSHOT_CACHE_TTL,
+    SCREENSHOT_TIMEOUT,
+    SCREENSHOT_URL,
+)
+from .models import UCamera
+from .safe_logger import RedactingFilter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(RedactingFilter())
+
+
+class ScreenshotCache:
+    """LRU cache of camera screenshots with TTL and request coalescing."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        ttl: float = SCREENSHOT_CACHE_TTL,
+        max_bytes: int = SCREENSHOT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize screenshot cache."""
+        self._session = session
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._images: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[bytes | None]] = {}
+
+    def as_dict(self) -> dict[str, int]:
+        """Return cache usage for diagnostics."""
+        return {"images": len(self._images), "bytes": self._size}
+
+    async def async_get_image(self, camera: UCamera) -> bytes | None:
+        """Return a fresh screenshot, fetching it once for all waiting viewers."""
+        key = camera.number
+        if (cached := self._images.get(key)) and time.monotonic() - cached[
+            0
+        ] < self._ttl:
+            self._images.move_to_end(key)
+            return cached[1]
+
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(self._async_fetch(camera))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._inflight[key] = task
+        # Shielded, so a viewer going away does not cancel the shared fetch.
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, camera: UCamera) -> bytes | None:
+        """Fetch screenshot from the camera screenshot server."""
+        url = SCREENSHOT_URL.format(
+            domain=camera.servers.screenshot_domain,
+            number=camera.number,
+            token=camera.token_l,
+        )
+        try:
+            async with self._session.get(url, timeout=SCREENSHOT_TIMEOUT) as response:
+                response.raise_for_status()
+                image = await response.read()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Error fetching screenshot for %s: %s", camera.number, err)
+            return None
+        if not image:
+            return None
+        self._store(camera.number, image)
+        return image
+
+    def _store(self, key: str, image: bytes) -> None:
+        """Put image into cache, evicting least recently used ones."""
+        if (old := self._images.pop(key, None)) is not None:
+            self._size -= len(old[1])
+        if len(image) > self._max_bytes:
+            return
+        self._images[key] = (time.monotonic(), image)
+        self._size += len(image)
+        while self._size > self._max_bytes:
+            _, (_, evicted) = self._images.popitem(last=False)
+            self._size -= len(evicted)
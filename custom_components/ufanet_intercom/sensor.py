@@ -1,16 +1,86 @@
 """Sensors for Ufanet intercom."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .api import UfanetAPI
+from .const import API_CAMERAS, DOMAIN
+from .coordinator import UfanetDataCoordinator
+from .entity import UfanetRecordEntity
+from .metrics import ApiMetrics
+from .models import Contract, Intercom
+from .reconciler import EntityReconciler
+
+# Diagnostic sensors only read in-memory metrics.
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UfanetDiagnosticSensorDescription(SensorEntityDescription):
+    """Ufanet diagnostic sensor description."""
+
+    value_fn: Callable[[ApiMetrics], float | int | datetime | None]
 
-from .const import DOMAIN
-from .models import Contract
+
+def _last_success(metrics: ApiMetrics) -> datetime | None:
+    """Return time of the last successful request."""
+    if (timestamp := metrics.last_success) is None:
+        return None
+    return dt_util.utc_from_timestamp(timestamp)
+
+
+def _cameras_latency(metrics: ApiMetrics) -> float | None:
+    """Return latency of the last cameras request in milliseconds."""
+    if (endpoint := metrics.endpoints.get(API_CAMERAS)) is None:
+        return None
+    if (latency := endpoint.last_latency) is None:
+        return None
+    return round(latency * 1000)
+
+
+DIAGNOSTIC_SENSORS = (
+    UfanetDiagnosticSensorDescription(
+        key="api_errors",
+        name="API errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.errors,
+    ),
+    UfanetDiagnosticSensorDescription(
+        key="api_last_success",
+        name="API last success",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_last_success,
+    ),
+    UfanetDiagnosticSensorDescription(
+        key="api_cameras_latency",
+        name="API cameras latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_cameras_latency,
+    ),
+    UfanetDiagnosticSensorDescription(
+        key="token_refreshes",
+        name="Token refreshes",
+        icon="mdi:key-change",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.token_refreshes + metrics.logins,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -19,47 +89,97 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors."""
-    api = hass.data[DOMAIN][entry.entry_id]
-    intercoms = await api.get_intercoms()
-    contracts = await api.get_contract()
+    coordinator: UfanetDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        UfanetDiagnosticSensor(coordinator.api, entry, description)
+        for description in DIAGNOSTIC_SENSORS
+    )
 
-    sensors = []
-    for intercom in intercoms:
-        if intercom.is_fav:
-            sensors.append(IntercomStatusSensor(api, intercom))
+    # All contracts come from one request of the coordinator.
+    balances = EntityReconciler(
+        coordinator,
+        async_add_entities,
+        "contracts",
+        factory=lambda contract: SensorBalance(coordinator, contract),
+    )
+    entry.async_on_unload(balances.async_start())
 
-    for contract in contracts:
-        sensors.append
-    async_add_entities(sensors)
+    statuses = EntityReconciler(
+        coordinator,
+        async_add_entities,
+        "intercoms",
+        factory=lambda intercom: IntercomStatusSensor(coordinator, intercom),
+        include=lambda intercom: intercom.is_fav,
+    )
+    entry.async_on_unload(statuses.async_start())
 
 
-class IntercomStatusSensor(SensorEntity):
+class UfanetDiagnosticSensor(SensorEntity):
+    """Ufanet API metrics sensor."""
+
+    entity_description: UfanetDiagnosticSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        api: UfanetAPI,
+        entry: ConfigEntry,
+        description: UfanetDiagnosticSensorDescription,
+    ) -> None:
+        """Initialize diagnostic sensor."""
+        self.entity_description = description
+        self._metrics = api.metrics
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_native_value = description.value_fn(self._metrics)
+
+    async def async_update(self) -> None:
+        """Read metrics."""
+        self._attr_native_value = self.entity_description.value_fn(self._metrics)
+
+
+class IntercomStatusSensor(UfanetRecordEntity, SensorEntity):
     """Representation of intercom status sensor."""
 
-    def __init__(self, api, intercom):
-        self._api = api
-        self._intercom = intercom
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = ["online", "blocked"]
+
+    def __init__(self, coordinator: UfanetDataCoordinator, intercom: Intercom) -> None:
+        """Init intercom status."""
+        super().__init__(coordinator, "intercoms", intercom)
         self._attr_unique_id = f"{intercom.id}_status"
-        self._attr_name = f"{intercom.custom_name} Status"
-        self._attr_native_value = "online" if not intercom.is_blocked else "blocked"
 
+    @property
+    def name(self) -> str:
+        """Return name of the current intercom record."""
+        return f"{self.record.custom_name} Status"
 
-class SensorBalance(SensorEntity):
+    @property
+    def native_value(self) -> str:
+        """Return status of the current intercom record."""
+        return "online" if not self.record.is_blocked else "blocked"
+
+
+class SensorBalance(UfanetRecordEntity, SensorEntity):
     """Ufanet intercom balance sensor."""
 
-    def __init__(self, api, contract: Contract) -> None:
+    _attr_native_unit_of_measurement = "RUB"
+    _attr_icon = "mdi:currency-rub"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator: UfanetDataCoordinator, contract: Contract) -> None:
         """Init intercom balance."""
-        super().__init__()
-        self._api = api
-        self._contract = contract
-        self._attr_unique_id = contract.id
-        self._attr_name = "Balance"
-        self._attr_native_unit_of_measurement = "RUB"
-        self._attr_icon = "mdi:currency-rub"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-
-    async def async_update(self):
-        """Update balance."""
-        contract = await self._api.get_contract()
-        self._attr_native_value = contract[0].balance
+        super().__init__(coordinator, "contracts", contract)
+        self._attr_unique_id = f"{contract.id}_balance"
+
+    @property
+    def name(self) -> str:
+        """Return name of the current contract record."""
+        return f"{self.record.title} Balance"
+
+    @property
+    def native_value(self) -> float:
+        """Return balance of the current contract record."""
+        return self.record.balance
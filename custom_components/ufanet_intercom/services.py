@@ -0,0 +1,249 @@
+"""Ufanet intercom services."""
+
+import heapq
+import logging
+import time
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_COUNT,
+    ATTR_HOURS,
+    ATTR_INTERCOM_ID,
+    ATTR_INTERCOM_IDS,
+    ATTR_LIMIT,
+    ATTR_MAX_DISTANCE,
+    ATTR_MAX_PARALLEL,
+    ATTR_ROUTE,
+    ATTR_TIMEOUT,
+    ATTR_TYPES,
+    CONF_DOOR_ROUTES,
+    DOMAIN,
+    DOOR_OPEN_DEADLINE,
+    DOOR_OPEN_PARALLEL,
+    DOOR_OPEN_PARALLEL_MAX,
+    EVENT_DOOR_OPENED,
+    EVENT_RING,
+    HISTORY_MAX_RECORDS,
+    NEAREST_CAMERAS_DEFAULT,
+    NEAREST_CAMERAS_MAX,
+    SERVICE_GET_HISTORY,
+    SERVICE_NEAREST_CAMERAS,
+    SERVICE_OPEN_DOORS,
+)
+from .coordinator import UfanetDataCoordinator
+from .door import DoorOpener, async_open_doors
+from .models import UCamera
+
+_LOGGER = logging.getLogger(__name__)
+
+NEAREST_CAMERAS_SCHEMA = vol.Schema(
+    {
+        vol.Inclusive(ATTR_LATITUDE, "coordinates"): cv.latitude,
+        vol.Inclusive(ATTR_LONGITUDE, "coordinates"): cv.longitude,
+        vol.Optional(ATTR_COUNT, default=NEAREST_CAMERAS_DEFAULT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=NEAREST_CAMERAS_MAX)
+        ),
+        vol.Optional(ATTR_MAX_DISTANCE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+OPEN_DOORS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_INTERCOM_IDS, "doors"): vol.All(
+                cv.ensure_list, [vol.Coerce(int)]
+            ),
+            vol.Exclusive(ATTR_ROUTE, "doors"): cv.string,
+            vol.Optional(ATTR_MAX_PARALLEL, default=DOOR_OPEN_PARALLEL): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=DOOR_OPEN_PARALLEL_MAX)
+            ),
+            vol.Optional(ATTR_TIMEOUT, default=DOOR_OPEN_DEADLINE): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=60)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_INTERCOM_IDS, ATTR_ROUTE),
+)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_INTERCOM_ID): vol.Coerce(int),
+        vol.Optional(ATTR_TYPES): vol.All(
+            cv.ensure_list, [vol.In([EVENT_RING, EVENT_DOOR_OPENED])]
+        ),
+        vol.Optional(ATTR_HOURS, default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=HISTORY_MAX_RECORDS)
+        ),
+    }
+)
+
+
+def _resolve_doors(
+    coordinators: list[UfanetDataCoordinator], call: ServiceCall
+) -> list[tuple[UfanetDataCoordinator, int]]:
+    """Return the coordinator of every requested door."""
+    if (route := call.data.get(ATTR_ROUTE)) is not None:
+        for coordinator in coordinators:
+            routes = coordinator.entry.options.get(CONF_DOOR_ROUTES, {})
+            if route in routes:
+                return [(coordinator, intercom_id) for intercom_id in routes[route]]
+        raise ServiceValidationError(f"Unknown door route {route}")
+
+    doors = []
+    for intercom_id in dict.fromkeys(call.data[ATTR_INTERCOM_IDS]):
+        owner = next(
+            (c for c in coordinators if intercom_id in c.records["intercoms"]), None
+        )
+        if owner is None:
+            raise ServiceValidationError(f"Unknown intercom {intercom_id}")
+        doors.append((owner, intercom_id))
+    return doors
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def async_nearest_cameras(call: ServiceCall) -> ServiceResponse:
+        """Return cameras nearest to a point, home by default."""
+        lat = call.data.get(ATTR_LATITUDE, hass.config.latitude)
+        lon = call.data.get(ATTR_LONGITUDE, hass.config.longitude)
+        count = call.data[ATTR_COUNT]
+        max_distance = call.data.get(ATTR_MAX_DISTANCE)
+        indexes = [
+            coordinator.camera_index
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+        ]
+
+        def _nearest() -> list[tuple[float, UCamera]]:
+            return heapq.nsmallest(
+                count,
+                (
+                    item
+                    for index in indexes
+                    for item in index.nearest(lat, lon, count, max_distance)
+                ),
+                key=lambda item: item[0],
+            )
+
+        # Indexes are replaced, never changed, so they can be read off the loop.
+        found = await hass.async_add_executor_job(_nearest)
+        registry = er.async_get(hass)
+        return {
+            "cameras": [
+                {
+                    "number": camera.number,
+                    "title": camera.title,
+                    "address": camera.address,
+                    "latitude": camera.latitude,
+                    "longitude": camera.longitude,
+                    "distance": round(dist),
+                    "entity_id": registry.async_get_entity_id(
+                        Platform.CAMERA, DOMAIN, camera.number
+                    ),
+                }
+                for dist, camera in found
+            ]
+        }
+
+    async def async_open_doors_service(call: ServiceCall) -> ServiceResponse:
+        """Open several doors at once."""
+        coordinators: list[UfanetDataCoordinator] = list(
+            hass.data.get(DOMAIN, {}).values()
+        )
+        doors = _resolve_doors(coordinators, call)
+        for coordinator in {coordinator for coordinator, _ in doors}:
+            coordinator.async_boost()
+        start = time.monotonic()
+        openers: list[tuple[DoorOpener, int]] = [
+            (coordinator.doors, intercom_id) for coordinator, intercom_id in doors
+        ]
+        results = await async_open_doors(
+            openers, call.data[ATTR_MAX_PARALLEL], call.data[ATTR_TIMEOUT]
+        )
+        for result in results:
+            if not result["success"]:
+                _LOGGER.error(
+                    "Failed to open intercom %s: %s",
+                    result["intercom_id"],
+                    result["error"],
+                )
+        if not call.return_response:
+            return None
+        return {
+            "doors": results,
+            "elapsed": round(time.monotonic() - start, 3),
+        }
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return buffered call and door history, newest first."""
+        coordinators: list[UfanetDataCoordinator] = list(
+            hass.data.get(DOMAIN, {}).values()
+        )
+        intercom_id = call.data.get(ATTR_INTERCOM_ID)
+        if intercom_id is not None:
+            coordinators = [
+                c for c in coordinators if intercom_id in c.records["intercoms"]
+            ]
+        since = time.time() - call.data[ATTR_HOURS] * 3600
+        records = []
+        for coordinator in coordinators:
+            try:
+                # Usually a single request for what happened since last sync.
+                await coordinator.history.async_sync()
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Answering from local history: %s", err)
+            records += coordinator.history.query(
+                intercom_id, since, call.data.get(ATTR_TYPES), call.data[ATTR_LIMIT]
+            )
+        records.sort(key=lambda record: record.time, reverse=True)
+        return {
+            "records": [
+                {
+                    "id": record.id,
+                    "intercom_id": record.intercom,
+                    "type": record.type,
+                    "time": dt_util.utc_from_timestamp(record.time).isoformat(),
+                    "who": record.who,
+                }
+                for record in records[: call.data[ATTR_LIMIT]]
+            ]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OPEN_DOORS,
+        async_open_doors_service,
+        schema=OPEN_DOORS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_NEAREST_CAMERAS,
+        async_nearest_cameras,
+        schema=NEAREST_CAMERAS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,137 @@
+"""HTTP transport tuned for the Ufanet API."""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from aiohttp.hdrs import AUTHORIZATION, USER_AGENT
+from yarl import URL
+
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    HUB_CONNECTION_LIMIT,
+    HUB_DNS_CACHE_TTL,
+    HUB_KEEPALIVE_TIMEOUT,
+    HUB_WARMUP_CONNECTIONS,
+    HUB_WARMUP_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """New against reused connections of the pool."""
+
+    created: int = 0
+    reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        total = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_ratio": round(self.reused / total, 3) if total else None,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+def _trace_config(stats: ConnectionStats) -> TraceConfig:
+    """Return trace config counting pool events into stats."""
+    trace = TraceConfig()
+
+    async def _created(*_: Any) -> None:
+        stats.created += 1
+
+    async def _reused(*_: Any) -> None:
+        stats.reused += 1
+
+    async def _dns_hit(*_: Any) -> None:
+        stats.dns_cache_hits += 1
+
+    async def _dns_miss(*_: Any) -> None:
+        stats.dns_cache_misses += 1
+
+    trace.on_connection_create_end.append(_created)
+    trace.on_connection_reuseconn.append(_reused)
+    trace.on_dns_cache_hit.append(_dns_hit)
+    trace.on_dns_cache_miss.append(_dns_miss)
+    return trace
+
+
+def create_session(stats: ConnectionStats) -> ClientSession:
+    """Return session with a pool sized for the Ufanet hosts.
+
+    Connections are kept alive between polls, so TLS handshakes happen once
+    per connection instead of once per request.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            ssl=ssl_util.get_default_context(),
+            limit=HUB_CONNECTION_LIMIT,
+            limit_per_host=HUB_CONNECTION_LIMIT,
+            ttl_dns_cache=HUB_DNS_CACHE_TTL,
+            keepalive_timeout=HUB_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        ),
+        headers={USER_AGENT: SERVER_SOFTWARE},
+        json_serialize=json_dumps,
+        trace_configs=[_trace_config(stats)],
+    )
+
+
+async def async_warm_up(session: ClientSession, url: str) -> None:
+    """Open pool connections to a host before the first real request."""
+
+    async def _async_head() -> None:
+        async with session.head(url, timeout=ClientTimeout(total=HUB_WARMUP_TIMEOUT)):
+            pass
+
+    # Concurrent requests can't share a connection, each opens one.
+    results = await asyncio.gather(
+        *(_async_head() for _ in range(HUB_WARMUP_CONNECTIONS)),
+        return_exceptions=True,
+    )
+    if errors := [r for r in results if isinstance(r, Exception)]:
+        _LOGGER.debug("Warm-up of %s failed: %s", url, errors[0])
+
+
+class RequestTemplates:
+    """URLs, timeouts and auth headers built once instead of per request."""
+
+    def __init__(self, host: str) -> None:
+        """Initialize templates of a host."""
+        self.host = host
+        self._urls: dict[str, URL] = {}
+        self._timeouts: dict[float, ClientTimeout] = {}
+        self._auth: tuple[str, dict[str, str]] | None = None
+
+    def url(self, endpoint: str = "") -> URL:
+        """Return url of an endpoint."""
+        if (url := self._urls.get(endpoint)) is None:
+            url = self._urls[endpoint] = URL(f"{self.host}{endpoint}")
+        return url
+
+    def timeout(self, seconds: float) -> ClientTimeout:
+        """Return timeout of seconds total."""
+        if (timeout := self._timeouts.get(seconds)) is None:
+            timeout = self._timeouts[seconds] = ClientTimeout(total=seconds)
+        return timeout
+
+    def headers(
+        self, access: str, extra: dict[str, str] | None = None
+    ) -> dict[str, str]:
+        """Return authorized headers, rebuilt only when the token changes."""
+        if self._auth is None or self._auth[0] != access:
+            self._auth = (access, {AUTHORIZATION: f"JWT {access}"})
+        headers = self._auth[1]
+        return {**headers, **extra} if extra else headers
@@ -0,0 +1 @@
+"""Tests for the Ufanet intercom integration."""
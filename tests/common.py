@@ -0,0 +1,13 @@
+"""Helpers shared by the tests."""
+
+import asyncio
+from collections.abc import Callable
+import time
+
+
+async def async_wait_until(predicate: Callable[[], bool], timeout: float = 10) -> None:
+    """Wait until predicate holds, failing the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
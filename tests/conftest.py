@@ -0,0 +1,57 @@
+"""Fixtures running the integration against the local fake servers."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.const import (
+    CONF_CONTRACT,
+    CONF_HOST,
+    CONF_PASSWORD,
+    DOMAIN,
+)
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.hub import async_get_hub
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+async def ufanet(socket_enabled: None) -> AsyncIterator[FakeUfanet]:
+    """Return a running fake Ufanet API."""
+    server = FakeUfanet()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant, ufanet: FakeUfanet) -> MockConfigEntry:
+    """Return a config entry for the fake API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Ufanet 12345",
+        unique_id="12345",
+        data={CONF_CONTRACT: "12345", CONF_PASSWORD: "secret", CONF_HOST: ufanet.url},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> AsyncIterator[UfanetDataCoordinator]:
+    """Return a coordinator talking to the fake API."""
+    coordinator = UfanetDataCoordinator(hass, config_entry, async_get_hub(hass))
+    # Every request must reach the server.
+    coordinator.api.coalesce_window = 0
+    yield coordinator
+    await coordinator.async_shutdown()
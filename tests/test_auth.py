@@ -0,0 +1,90 @@
+"""Tests for the token lifecycle."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.auth import TokenManager
+from custom_components.ufanet_intercom.const import API_AUTH, API_REFRESH
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.models import Token
+
+
+def _token(name: str, ttl: int = 3600) -> Token:
+    """Return a token expiring in ttl seconds."""
+    return Token(access=name, refresh=f"refresh-{name}", exp=int(time.time()) + ttl)
+
+
+async def test_single_flight_renewal(hass: HomeAssistant) -> None:
+    """Concurrent callers share one login."""
+    release = asyncio.Event()
+
+    async def _login() -> Token:
+        await release.wait()
+        return _token("new")
+
+    login = AsyncMock(side_effect=_login)
+    tokens = TokenManager(hass, login, AsyncMock())
+    waiters = [asyncio.create_task(tokens.async_get_token()) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert {token.access for token in await asyncio.gather(*waiters)} == {"new"}
+    assert login.await_count == 1
+    await tokens.async_shutdown()
+
+
+async def test_refresh_falls_back_to_login(hass: HomeAssistant) -> None:
+    """An expired token is refreshed, a failed refresh logs in again."""
+    login = AsyncMock(return_value=_token("login"))
+    refresh = AsyncMock(side_effect=[_token("refreshed"), Exception("expired")])
+    tokens = TokenManager(hass, login, refresh)
+    tokens.set_token(_token("old", ttl=0))
+
+    assert (await tokens.async_get_token()).access == "refreshed"
+    refresh.assert_awaited_once_with("refresh-old")
+    tokens.set_token(_token("old", ttl=0))
+    assert (await tokens.async_get_token()).access == "login"
+    assert login.await_count == 1
+    await tokens.async_shutdown()
+
+
+async def test_reauthenticate_once_for_concurrent_rejections(
+    hass: HomeAssistant,
+) -> None:
+    """Callers rejected with the same token share one renewal."""
+    refresh = AsyncMock(return_value=_token("new"))
+    tokens = TokenManager(hass, AsyncMock(), refresh)
+    old = _token("old")
+    tokens.set_token(old)
+
+    renewed = await asyncio.gather(
+        *(tokens.async_reauthenticate(old) for _ in range(5))
+    )
+    assert {token.access for token in renewed} == {"new"}
+    # A late caller with the old token gets the renewed one as is.
+    assert (await tokens.async_reauthenticate(old)).access == "new"
+    assert refresh.await_count == 1
+    await tokens.async_shutdown()
+
+
+async def test_requests_reauthenticate_on_401(
+    ufanet: FakeUfanet, coordinator: UfanetDataCoordinator
+) -> None:
+    """Requests rejected with a revoked token renew it once and retry."""
+    api = coordinator.api
+    await api.async_authenticate()
+    ufanet.revoke_tokens()
+
+    intercoms, cameras, contracts = await asyncio.gather(
+        api.async_get_intercoms(),
+        api.async_get_cameras(),
+        api.async_get_contracts(),
+    )
+
+    assert intercoms and cameras and contracts
+    assert ufanet.config.requests[f"/{API_AUTH}"] == 1
+    assert ufanet.config.requests[f"/{API_REFRESH}"] == 1
@@ -0,0 +1,103 @@
+"""Tests for coordinator poll scheduling."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.const import (
+    API_CAMERAS,
+    API_CONTRACT,
+    API_INTERCOMS,
+    BOOST_UPDATE_INTERVAL,
+    BOOST_WINDOW,
+    CAMERAS_UPDATE_INTERVAL,
+    PUSH_UPDATE_INTERVAL,
+)
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+
+
+def _polls(ufanet: FakeUfanet) -> tuple[int, int, int]:
+    """Return intercoms, cameras and contract request counts."""
+    requests = ufanet.config.requests
+    return tuple(
+        requests.get(f"/{endpoint}", 0)
+        for endpoint in (API_INTERCOMS, API_CAMERAS, API_CONTRACT)
+    )
+
+
+async def test_polls_due_endpoints_only(
+    ufanet: FakeUfanet,
+    coordinator: UfanetDataCoordinator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Each endpoint is fetched on its own interval."""
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (1, 1, 1)
+    assert coordinator.update_interval == timedelta(seconds=CAMERAS_UPDATE_INTERVAL)
+
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (1, 1, 1)
+
+    freezer.tick(CAMERAS_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (1, 2, 1)
+
+
+async def test_unchanged_endpoint_backs_off(
+    ufanet: FakeUfanet,
+    coordinator: UfanetDataCoordinator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Unchanged cameras are polled less often until they change."""
+    await coordinator.async_refresh()
+    cameras = []
+    for tick in range(8):
+        if tick == 3:
+            ufanet.rotate_tokens(1)
+        freezer.tick(CAMERAS_UPDATE_INTERVAL)
+        await coordinator.async_refresh()
+        cameras.append(_polls(ufanet)[1])
+    # Every 30 s, 60 s and 120 s, the change seen at 210 s resets to 30 s.
+    assert cameras == [2, 2, 3, 3, 3, 3, 4, 5]
+
+
+async def test_boost_polls_fast_for_a_while(
+    ufanet: FakeUfanet,
+    coordinator: UfanetDataCoordinator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A boost polls intercoms and cameras fast, then returns to normal."""
+    await coordinator.async_refresh()
+    coordinator.async_boost()
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=BOOST_UPDATE_INTERVAL)
+
+    freezer.tick(BOOST_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (2, 2, 1)
+
+    freezer.tick(BOOST_WINDOW)
+    await coordinator.async_refresh()
+    polls = _polls(ufanet)
+    freezer.tick(BOOST_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == polls
+
+
+async def test_push_slows_polling(
+    ufanet: FakeUfanet,
+    coordinator: UfanetDataCoordinator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Healthy push delivery stretches the camera poll interval."""
+    await coordinator.async_refresh()
+    coordinator._async_set_push_healthy(True)
+
+    freezer.tick(CAMERAS_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (1, 1, 1)
+
+    freezer.tick(PUSH_UPDATE_INTERVAL - CAMERAS_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert _polls(ufanet) == (1, 2, 1)
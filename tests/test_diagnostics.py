@@ -0,0 +1,31 @@
+"""Tests for the diagnostics dump."""
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+from custom_components.ufanet_intercom.const import DOMAIN
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_contract_is_redacted(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: UfanetDataCoordinator,
+) -> None:
+    """The contract number does not leak through the entry."""
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    await coordinator.async_refresh()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    entry = diagnostics["entry"]
+    assert entry["title"] == REDACTED
+    assert entry["unique_id"] == REDACTED
+    assert entry["data"]["contract"] == REDACTED
+    assert entry["data"]["password"] == REDACTED
+    assert "12345" not in repr(diagnostics)
@@ -0,0 +1,43 @@
+"""Tests for the door command path."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.ufanet_intercom.api import UfanetAPI
+from custom_components.ufanet_intercom.const import (
+    HUB_KEEPALIVE_TIMEOUT,
+    SHARED_KEEPALIVE_TIMEOUT,
+)
+from custom_components.ufanet_intercom.door import DoorOpener
+from custom_components.ufanet_intercom.hub import async_get_hub
+
+
+@pytest.mark.parametrize(
+    ("dedicated", "timeout"),
+    [(False, SHARED_KEEPALIVE_TIMEOUT), (True, HUB_KEEPALIVE_TIMEOUT)],
+)
+async def test_keepalive_before_idle_timeout(
+    hass: HomeAssistant, dedicated: bool, timeout: float
+) -> None:
+    """The pooled connection is pinged before the session drops it."""
+    api = UfanetAPI(
+        hass, "12345", "secret", async_get_hub(hass), dedicated_transport=dedicated
+    )
+    assert api.keepalive_timeout == timeout
+    doors = DoorOpener(hass, api)
+    with patch.object(api, "async_ping") as ping:
+        unregister = doors.async_register()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=timeout))
+        await hass.async_block_till_done()
+        assert ping.call_count == 1
+
+        unregister()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=timeout * 3))
+        await hass.async_block_till_done()
+        assert ping.call_count == 1
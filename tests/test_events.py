@@ -0,0 +1,86 @@
+"""Tests for the intercom event listener."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.const import (
+    API_EVENTS,
+    EVENTS_MAX_REJECTIONS,
+    SIGNAL_INTERCOM_EVENT,
+)
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+
+from .common import async_wait_until
+
+
+async def test_reconnects_after_server_error(
+    hass: HomeAssistant,
+    ufanet: FakeUfanet,
+    config_entry: MockConfigEntry,
+    coordinator: UfanetDataCoordinator,
+) -> None:
+    """A failing channel is retried, not given up on."""
+    received: asyncio.Queue[dict] = asyncio.Queue()
+
+    @callback
+    def _received(event: dict) -> None:
+        received.put_nowait(event)
+
+    async_dispatcher_connect(
+        hass,
+        SIGNAL_INTERCOM_EVENT.format(entry_id=config_entry.entry_id, intercom_id=0),
+        _received,
+    )
+    events = coordinator.events
+    ufanet.config.error_rate = 1.0
+    events.async_start()
+    await async_wait_until(lambda: events.reconnects > 0)
+    assert not events.healthy
+
+    ufanet.config.error_rate = 0.0
+    await async_wait_until(lambda: events.healthy)
+    await ufanet.push_event(0)
+    event = await asyncio.wait_for(received.get(), 10)
+
+    assert event["intercom"] == 0
+    assert events.supported
+    assert events.as_dict()["events"] == 1
+
+
+async def test_stops_when_not_supported(
+    ufanet: FakeUfanet, coordinator: UfanetDataCoordinator
+) -> None:
+    """Only a missing endpoint turns the channel off."""
+    events = coordinator.events
+    ufanet.config.events = False
+    events.async_start()
+    await async_wait_until(lambda: not events.supported)
+
+    assert not events.healthy
+    assert events.reconnects == 0
+    assert ufanet.config.requests[f"/{API_EVENTS}"] == 1
+
+
+@pytest.mark.parametrize(
+    ("status", "body"), [(403, "Forbidden"), (200, "<html>maintenance</html>")]
+)
+async def test_gives_up_when_rejected(
+    ufanet: FakeUfanet, coordinator: UfanetDataCoordinator, status: int, body: str
+) -> None:
+    """Refused or garbled answers back off hard and end on polling."""
+    events = coordinator.events
+    ufanet.config.events_status = status
+    ufanet.config.events_body = body
+    with patch("custom_components.ufanet_intercom.events.EVENTS_RECONNECT_MAX", 0.01):
+        events.async_start()
+        await async_wait_until(lambda: not events.supported)
+
+    assert not events.healthy
+    assert ufanet.config.requests[f"/{API_EVENTS}"] == EVENTS_MAX_REJECTIONS
@@ -0,0 +1,56 @@
+"""Tests for the camera spatial index."""
+
+import random
+
+from benchmarks.bench_models import make_cameras
+from custom_components.ufanet_intercom.geo import CameraIndex, distance
+from custom_components.ufanet_intercom.models import UCamera
+
+
+def _cameras(points: list[tuple[float, float]]) -> list[UCamera]:
+    """Return cameras at the given coordinates."""
+    data = make_cameras(len(points))
+    for item, (lat, lon) in zip(data, points):
+        item["latitude"], item["longitude"] = lat, lon
+    return [UCamera(**item) for item in data]
+
+
+def test_nearest_with_equal_distances() -> None:
+    """Cameras on one building are returned, not compared."""
+    cameras = _cameras([(54.7348, 55.9579)] * 5 + [(54.74, 55.96)])
+    index = CameraIndex(cameras)
+
+    building = {camera.number for camera in cameras[:5]}
+    found = index.nearest(54.7348, 55.9579, 5)
+    assert {camera.number for _, camera in found} == building
+    assert all(dist == 0 for dist, _ in found)
+    within = index.within(54.7348, 55.9579, 10)
+    assert {camera.number for camera in within} == building
+
+
+def test_nearest_matches_scan() -> None:
+    """The grid walk finds the same cameras as checking all of them."""
+    rng = random.Random(1)
+    cameras = _cameras(
+        [(54.7 + rng.uniform(0, 0.1), 55.9 + rng.uniform(0, 0.1)) for _ in range(500)]
+    )
+    index = CameraIndex(cameras)
+
+    # Inside the city and far outside of it.
+    for lat, lon in ((54.75, 55.95), (54.7, 56.1), (60.0, 30.0)):
+        expected = sorted(
+            distance(lat, lon, camera.latitude, camera.longitude) for camera in cameras
+        )
+        found = index.nearest(lat, lon, 10)
+        assert [round(dist, 6) for dist, _ in found] == [
+            round(dist, 6) for dist in expected[:10]
+        ]
+        within = index.within(lat, lon, 2000)
+        assert len(within) == sum(dist <= 2000 for dist in expected)
+
+
+def test_empty_index() -> None:
+    """Queries on no cameras find nothing."""
+    index = CameraIndex([])
+    assert index.nearest(54.7, 55.9, 5) == []
+    assert index.within(54.7, 55.9, 1000) == []
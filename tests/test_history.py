@@ -0,0 +1,53 @@
+"""Tests for the history buffer."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.const import API_HISTORY, HISTORY_PAGE_SIZE
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.exceptions import UfanetIntercomAPIError
+from custom_components.ufanet_intercom.history import HistoryStore
+
+
+async def test_sync_advances_cursor(
+    hass: HomeAssistant, ufanet: FakeUfanet, coordinator: UfanetDataCoordinator
+) -> None:
+    """Each sync fetches only the records after the cursor."""
+    store = coordinator.history
+    requests = ufanet.config.requests
+    ufanet.add_history(HISTORY_PAGE_SIZE + 50)
+
+    assert await store.async_sync() == HISTORY_PAGE_SIZE + 50
+    assert store.cursor == str(HISTORY_PAGE_SIZE + 50)
+    assert requests[f"/{API_HISTORY}"] == 2
+
+    assert await store.async_sync() == 0
+    assert requests[f"/{API_HISTORY}"] == 3
+
+    ufanet.add_history(5)
+    assert await store.async_sync() == 5
+    assert store.cursor == str(HISTORY_PAGE_SIZE + 55)
+    assert len(store) == HISTORY_PAGE_SIZE + 55
+    assert requests[f"/{API_HISTORY}"] == 4
+
+    # The cursor survives a restart.
+    await store.async_stop()
+    restored = HistoryStore(hass, coordinator.entry, coordinator.api)
+    await restored.async_load()
+    assert restored.cursor == store.cursor
+    assert len(restored) == len(store)
+
+
+async def test_server_error_keeps_history(
+    ufanet: FakeUfanet, coordinator: UfanetDataCoordinator
+) -> None:
+    """A failing server does not turn history off."""
+    store = coordinator.history
+    await coordinator.api.async_authenticate()
+    ufanet.config.error_rate = 1.0
+    with pytest.raises(UfanetIntercomAPIError):
+        await store.async_sync()
+    assert store.supported
+    assert store.cursor is None
@@ -0,0 +1,22 @@
+"""Tests for the shared hub."""
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.bench_models import make_cameras
+from custom_components.ufanet_intercom.hub import async_get_hub
+from custom_components.ufanet_intercom.models import UCamera
+
+
+async def test_intern_camera_with_lists(hass: HomeAssistant) -> None:
+    """Payloads with list values are shared between contracts too."""
+    hub = async_get_hub(hass)
+    first, second = make_cameras(1), make_cameras(1)
+    for data in (first[0], second[0]):
+        data["tags"] = ["public"]
+        data["servers"]["ports"] = [554, 8554]
+
+    camera = hub.intern_camera(first[0], UCamera.model_validate)
+    assert hub.intern_camera(second[0], UCamera.model_validate) is camera
+
+    second[0]["tags"].append("entrance")
+    assert hub.intern_camera(second[0], UCamera.model_validate) is not camera
@@ -0,0 +1,38 @@
+"""Tests for payload parsing."""
+
+from unittest.mock import patch
+
+from benchmarks.bench_models import make_cameras
+from custom_components.ufanet_intercom.models import UCamera
+from custom_components.ufanet_intercom.parsing import ModelParser
+
+
+def test_unchanged_items_skip_validation() -> None:
+    """Equal items return the previous model, changed ones are validated."""
+    parser = ModelParser(UCamera, "number")
+    first = parser.parse_list(make_cameras(3))
+
+    data = make_cameras(3)
+    data[1]["token_l"] = "f" * 32
+    data[2]["latitude"] = str(data[2]["latitude"])
+    with patch.object(
+        UCamera, "model_validate", wraps=UCamera.model_validate
+    ) as validate:
+        second = parser.parse_list(data)
+
+    assert validate.call_count == 2
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert second[1].rtsp_url.endswith("f" * 32)
+    # Coerced to the same values, the old instance is kept.
+    assert second[2] is first[2]
+
+
+def test_removed_items_are_forgotten() -> None:
+    """Items missing from a payload do not keep their model."""
+    parser = ModelParser(UCamera, "number")
+    data = make_cameras(3)
+    first = parser.parse_list(data)
+
+    parser.parse_list(data[:2])
+    assert parser.parse_list(data)[2] is not first[2]
@@ -0,0 +1,63 @@
+"""Tests for entity reconciliation."""
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from benchmarks.fake_ufanet import FakeUfanet
+from custom_components.ufanet_intercom.const import DEFAULT_MAX_UPDATE_INTERVAL
+from custom_components.ufanet_intercom.coordinator import UfanetDataCoordinator
+from custom_components.ufanet_intercom.models import Intercom
+from custom_components.ufanet_intercom.reconciler import EntityReconciler
+
+
+class _Entity(Entity):
+    """Entity that records its removal."""
+
+    def __init__(self, intercom: Intercom) -> None:
+        """Initialize entity."""
+        self.intercom = intercom
+        self.removed = False
+
+    async def async_remove(self, *, force_remove: bool = False) -> None:
+        """Note removal."""
+        self.removed = True
+
+
+async def test_adds_and_removes_by_key(
+    hass: HomeAssistant,
+    ufanet: FakeUfanet,
+    coordinator: UfanetDataCoordinator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Entities follow included records, unchanged data adds nothing."""
+    added: list[_Entity] = []
+    reconciler = EntityReconciler(
+        coordinator,
+        added.extend,
+        "intercoms",
+        factory=_Entity,
+        include=lambda intercom: intercom.is_fav,
+    )
+    unsub = reconciler.async_start()
+    assert not added
+
+    await coordinator.async_refresh()
+    assert sorted(entity.intercom.id for entity in added) == [0, 2]
+
+    freezer.tick(DEFAULT_MAX_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert len(added) == 2
+
+    ufanet.set_payload(intercoms=6)
+    freezer.tick(DEFAULT_MAX_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    assert sorted(entity.intercom.id for entity in added) == [0, 2, 4]
+
+    ufanet.set_payload(intercoms=1)
+    freezer.tick(DEFAULT_MAX_UPDATE_INTERVAL)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert [entity.intercom.id for entity in added if not entity.removed] == [0]
+    unsub()
@@ -0,0 +1,91 @@
+"""Tests for backoff and the circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.ufanet_intercom.exceptions import (
+    CircuitOpenUfanetIntercomAPIError,
+)
+from custom_components.ufanet_intercom.resilience import CircuitBreaker, backoff_delay
+
+
+@pytest.fixture
+def clock():
+    """Return a controllable monotonic clock for the breaker."""
+    with patch("custom_components.ufanet_intercom.resilience.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    """Fail until the circuit opens."""
+    for _ in range(3):
+        assert not breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold(clock) -> None:
+    """Requests are rejected once the threshold is reached."""
+    breaker = CircuitBreaker("cameras", threshold=3, reset_timeout=10)
+    _trip(breaker)
+
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenUfanetIntercomAPIError) as err:
+        breaker.before_request()
+    assert err.value.retry_after == 10
+
+
+def test_half_open_lets_one_probe_through(clock) -> None:
+    """After the reset timeout a single probe is sent, success closes."""
+    breaker = CircuitBreaker("cameras", threshold=3, reset_timeout=10)
+    _trip(breaker)
+    clock.monotonic.return_value += 10
+
+    assert breaker.before_request()
+    # Concurrent requests wait for the probe's verdict.
+    with pytest.raises(CircuitOpenUfanetIntercomAPIError):
+        breaker.before_request()
+    breaker.record_success()
+
+    assert not breaker.is_open
+    assert not breaker.before_request()
+
+
+def test_failed_probe_doubles_timeout(clock) -> None:
+    """A failed probe reopens the circuit for longer, up to the maximum."""
+    breaker = CircuitBreaker(
+        "cameras", threshold=3, reset_timeout=10, max_reset_timeout=30
+    )
+    _trip(breaker)
+    for timeout in (20, 30, 30):
+        clock.monotonic.return_value += breaker.remaining()
+        assert breaker.before_request()
+        breaker.record_failure()
+        assert breaker.remaining() == timeout
+
+
+def test_released_probe_can_be_retried(clock) -> None:
+    """A probe that ended without a verdict lets the next request probe."""
+    breaker = CircuitBreaker("cameras", threshold=3, reset_timeout=10)
+    _trip(breaker)
+    clock.monotonic.return_value += 10
+
+    assert breaker.before_request()
+    breaker.release_probe()
+    assert breaker.before_request()
+
+
+def test_retry_after_holds_requests(clock) -> None:
+    """Retry-After delays requests even below the threshold."""
+    breaker = CircuitBreaker("cameras", threshold=3, reset_timeout=10)
+    breaker.record_failure(retry_after=60)
+
+    assert breaker.remaining() == 60
+    with pytest.raises(CircuitOpenUfanetIntercomAPIError):
+        breaker.before_request()
+
+
+def test_backoff_delay_is_capped() -> None:
+    """Delays never exceed the cap."""
+    assert all(0 <= backoff_delay(attempt, 300) <= 300 for attempt in range(30))
@@ -0,0 +1,73 @@
+"""Tests for the RTSP camera prober."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.bench_models import make_cameras
+from benchmarks.fake_rtsp import FakeRtsp
+from custom_components.ufanet_intercom.models import UCamera
+from custom_components.ufanet_intercom.rtsp import CameraProber
+
+
+@pytest.fixture
+async def rtsp(socket_enabled: None) -> AsyncIterator[FakeRtsp]:
+    """Return a running fake RTSP server."""
+    server = FakeRtsp()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _make_due(prober: CameraProber) -> None:
+    """Let the next round probe every camera and server again."""
+    for state in (*prober.states.values(), *prober.servers.values()):
+        state.next_probe = 0
+
+
+async def test_availability_follows_probes(
+    hass: HomeAssistant, config_entry: MockConfigEntry, rtsp: FakeRtsp
+) -> None:
+    """Cameras flip availability as their streams fail and recover."""
+    data = make_cameras(4)
+    for item in data:
+        item["servers"]["domain"] = rtsp.domain
+    cameras = [UCamera(**item) for item in data]
+    dead = cameras[0].number
+    changes: list[set[str]] = []
+    prober = CameraProber(hass, config_entry, changes.append)
+
+    await prober.async_probe_due(cameras)
+    assert all(prober.available(camera.number) for camera in cameras)
+    assert prober.latency(dead) is not None
+    assert not changes
+
+    rtsp.config.dead.add(dead)
+    _make_due(prober)
+    await prober.async_probe_due(cameras)
+    assert not prober.available(dead)
+    assert changes.pop() == {dead}
+
+    rtsp.config.dead.clear()
+    _make_due(prober)
+    await prober.async_probe_due(cameras)
+    assert prober.available(dead)
+    assert changes.pop() == {dead}
+
+    # A server that is down fails all of its cameras and backs off.
+    await rtsp.stop()
+    _make_due(prober)
+    await prober.async_probe_due(cameras)
+    assert not any(prober.available(camera.number) for camera in cameras)
+    assert changes.pop() == {camera.number for camera in cameras}
+    assert prober.servers[rtsp.domain].failures == 1
+
+    await rtsp.start()
+    _make_due(prober)
+    await prober.async_probe_due(cameras)
+    assert all(prober.available(camera.number) for camera in cameras)
+    assert changes.pop() == {camera.number for camera in cameras}
+    await prober.async_stop()